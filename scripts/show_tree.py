@@ -1,10 +1,10 @@
 import argparse
-from projectsummarizer.engine import build_tree, render_ascii_tree
 from projectsummarizer.cli import (
     add_file_selection_args,
     add_ignore_logic_args,
     add_token_counting_args,
     add_sorting_args,
+    validate_sorting_args,
     add_date_tracking_args,
 )
 from dotenv import load_dotenv
@@ -28,19 +28,11 @@ def main():
     args = parser.parse_args()
 
     # Validate sorting arguments
-    if args.sort_by in ["created", "modified"]:
-        # Date sorting requires --include-dates
-        if not args.include_dates:
-            parser.error(
-                f"When sorting by '{args.sort_by}', --include-dates must be enabled"
-            )
-    elif args.sort_by not in ["name", "size"]:
-        # Treat as token model - must be in count_tokens
-        if not args.count_tokens or args.sort_by not in args.count_tokens:
-            parser.error(
-                f"When sorting by token model '{args.sort_by}', "
-                f"it must be included in --count_tokens"
-            )
+    validate_sorting_args(parser, args)
+
+    # Import the engine only once the arguments are valid, so --help and
+    # usage errors return without loading the discovery and tree modules
+    from projectsummarizer.engine import build_tree, render_ascii_tree
 
     user_patterns = [pattern for pattern in args.ignore.split(",") if pattern] if args.ignore else []
 
@@ -53,7 +45,10 @@ def main():
         token_models=args.count_tokens or [],
         filter_type=args.filter,
         level=args.level,
+        scan_workers=args.scan_workers,
         include_dates=args.include_dates,
+        token_cache=not args.no_token_cache,
+        workers=args.workers,
     )
     print(render_ascii_tree(root, show_stats=True, sort_by=args.sort_by))
 
@@ -3,6 +3,7 @@
 
 import argparse
 import sys
+from collections import Counter
 from prettytable import PrettyTable
 from projectsummarizer.files.discovery.discoverer import FileDiscoverer
 from projectsummarizer.cli import (
@@ -17,9 +18,40 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 
 
-def create_pattern_table(patterns_by_origin, pattern_matches):
+class PlainTable:
+    """Minimal PrettyTable stand-in that renders aligned columns without borders.
+
+    PrettyTable pads and converts every cell in Python on each row; for large
+    pattern or extension listings that dominates the script's runtime. This
+    class supports the subset used here (field_names, align, add_row) and
+    computes each column width once.
+    """
+
+    _JUSTIFY = {"l": str.ljust, "r": str.rjust, "c": str.center}
+
+    def __init__(self):
+        self.field_names = []
+        self.align = {}
+        self._rows = []
+
+    def add_row(self, row):
+        self._rows.append([str(cell) for cell in row])
+
+    def __str__(self):
+        rows = [list(self.field_names)] + self._rows
+        widths = [max(len(row[i]) for row in rows) for i in range(len(self.field_names))]
+        justify = [self._JUSTIFY[self.align.get(name, "l")] for name in self.field_names]
+
+        lines = []
+        for row in rows:
+            lines.append("  ".join(j(cell, w) for j, cell, w in zip(justify, row, widths)).rstrip())
+        lines.insert(1, "  ".join("-" * w for w in widths))
+        return "\n".join(lines)
+
+
+def create_pattern_table(patterns_by_origin, pattern_matches, table_cls=PlainTable):
     """Create a table showing patterns by origin and their file counts."""
-    table = PrettyTable()
+    table = table_cls()
     table.field_names = ["Origin", "Pattern", "Files Affected"]
     table.align["Pattern"] = "l"
     table.align["Files Affected"] = "r"
@@ -32,40 +64,48 @@ def create_pattern_table(patterns_by_origin, pattern_matches):
     return table
 
 
-def create_binary_extensions_table(binary_extensions, checked_files):
+def create_binary_extensions_table(binary_extensions, checked_files, table_cls=PlainTable):
     """Create a table showing binary extensions and their file counts."""
-    table = PrettyTable()
+    table = table_cls()
     table.field_names = ["Extension", "Files Affected", "Blocked Files"]
     table.align["Extension"] = "l"
     table.align["Files Affected"] = "r"
     table.align["Blocked Files"] = "r"
     
+    # Group files by extension in a single pass instead of rescanning per extension
+    total_files = Counter()
+    blocked_files = Counter()
+    for data in checked_files.values():
+        ext = data.get("binary_extension")
+        if ext:
+            total_files[ext] += 1
+            if data.get("is_ignored", False):
+                blocked_files[ext] += 1
+    
     for ext in binary_extensions:
-        # Count total files with this extension
-        total_files = sum(1 for data in checked_files.values() 
-                         if data.get("binary_extension") == ext)
-        
-        # Count blocked files with this extension
-        blocked_files = sum(1 for data in checked_files.values() 
-                           if data.get("binary_extension") == ext and data.get("is_ignored", False))
-        
-        table.add_row([ext, total_files, blocked_files])
+        table.add_row([ext, total_files[ext], blocked_files[ext]])
     
     return table
 
 
-def create_ignore_summary_table(checked_files):
+def create_ignore_summary_table(checked_files, table_cls=PlainTable):
     """Create a summary table of ignore statistics."""
-    table = PrettyTable()
+    table = table_cls()
     table.field_names = ["Category", "Count"]
     table.align["Category"] = "l"
     table.align["Count"] = "r"
     
     total_files = len(checked_files)
-    ignored_files = sum(1 for data in checked_files.values() if data.get("is_ignored", False))
-    binary_files = sum(1 for data in checked_files.values() if data.get("is_binary", False))
-    binary_ignored = sum(1 for data in checked_files.values() 
-                        if data.get("is_binary", False) and data.get("is_ignored", False))
+    ignored_files = 0
+    binary_files = 0
+    binary_ignored = 0
+    # Count all categories in a single pass over the checked files
+    for data in checked_files.values():
+        is_ignored = data.get("is_ignored", False)
+        ignored_files += is_ignored
+        if data.get("is_binary", False):
+            binary_files += 1
+            binary_ignored += is_ignored
     
     table.add_row(["Total files checked", total_files])
     table.add_row(["Files ignored", ignored_files])
@@ -76,9 +116,9 @@ def create_ignore_summary_table(checked_files):
     return table
 
 
-def create_ignored_files_table(checked_files, max_files=20):
+def create_ignored_files_table(checked_files, max_files=20, table_cls=PlainTable):
     """Create a table showing detailed information about ignored files."""
-    table = PrettyTable()
+    table = table_cls()
     table.field_names = ["File", "Reason", "Binary", "Patterns"]
     table.align["File"] = "l"
     table.align["Reason"] = "l"
@@ -128,6 +168,11 @@ def main():
         action="store_true",
         help="Show detailed list of ignored files"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Draw bordered tables with PrettyTable (slower for large listings)"
+    )
 
     args = parser.parse_args()
     
@@ -143,8 +188,12 @@ def main():
         use_defaults=not args.no_defaults,
         read_ignore_files=not args.no_gitignore,
         include_binary=args.include_binary,  # Allow user to control binary file inclusion
+        prune_ignored_dirs=False,  # Statistics need every ignored file, not just the kept ones
+        scan_workers=args.scan_workers,
     )
 
+    table_cls = PrettyTable if args.pretty else PlainTable
+
     try:
         # Run discovery to populate pattern tracker
         discoverer.discover()
@@ -160,13 +209,13 @@ def main():
         print("=" * 50)
         
         # Summary table
-        summary_table = create_ignore_summary_table(checked_files)
+        summary_table = create_ignore_summary_table(checked_files, table_cls=table_cls)
         print("\n📈 SUMMARY")
         print(summary_table)
         
         # Pattern details table
         if patterns_by_origin:
-            pattern_table = create_pattern_table(patterns_by_origin, pattern_matches)
+            pattern_table = create_pattern_table(patterns_by_origin, pattern_matches, table_cls=table_cls)
             print("\n🎯 ACTIVE PATTERNS")
             print(pattern_table)
         else:
@@ -175,7 +224,7 @@ def main():
         
         # Binary extensions table
         if binary_extensions:
-            binary_table = create_binary_extensions_table(binary_extensions, checked_files)
+            binary_table = create_binary_extensions_table(binary_extensions, checked_files, table_cls=table_cls)
             print("\n🔒 BINARY FILE EXTENSIONS")
             print(binary_table)
         else:
@@ -186,7 +235,7 @@ def main():
         if args.show_ignored_files:
             ignored_files = [f for f, data in checked_files.items() if data.get("is_ignored", False)]
             if ignored_files:
-                ignored_table = create_ignored_files_table(checked_files)
+                ignored_table = create_ignored_files_table(checked_files, table_cls=table_cls)
                 print("\n📋 IGNORED FILES DETAILS")
                 print(ignored_table)
             else:
@@ -10,13 +10,13 @@ import pyperclip
 from dotenv import load_dotenv
 
 from projectsummarizer.call_logger import log_call
-from projectsummarizer.engine import build_tree, render_ascii_tree
 from projectsummarizer.contents.formatters import create_formatter
 from projectsummarizer.cli import (
     add_file_selection_args,
     add_ignore_logic_args,
     add_token_counting_args,
     add_sorting_args,
+    validate_sorting_args,
     add_date_tracking_args,
     add_format_args,
 )
@@ -71,19 +71,11 @@ def main():
     args = parser.parse_args()
 
     # Validate sorting arguments
-    if args.sort_by in ["created", "modified"]:
-        # Date sorting requires --include-dates
-        if not args.include_dates:
-            parser.error(
-                f"When sorting by '{args.sort_by}', --include-dates must be enabled"
-            )
-    elif args.sort_by not in ["name", "size"]:
-        # Treat as token model - must be in count_tokens
-        if not args.count_tokens or args.sort_by not in args.count_tokens:
-            parser.error(
-                f"When sorting by token model '{args.sort_by}', "
-                f"it must be included in --count_tokens"
-            )
+    validate_sorting_args(parser, args)
+
+    # Import the engine only once the arguments are valid, so --help and
+    # usage errors return without loading the discovery and tree modules
+    from projectsummarizer.engine import build_tree, render_ascii_tree
 
     # Add user-specified patterns
     user_patterns = []
@@ -113,9 +105,13 @@ def main():
             read_ignore_files=not args.no_gitignore,
             token_models=args.count_tokens or [],
             filter_type=args.filter,
+            # Without a content processor (and without token counting) files are not read at all
             content_processor=formatter.write_content if not args.only_structure else None,
             level=args.level,
+            scan_workers=args.scan_workers,
             include_dates=args.include_dates,
+            token_cache=not args.no_token_cache,
+            workers=args.workers,
         )
 
         # Prepend tree structure at the beginning (without stats for cleaner output)
@@ -8,34 +8,77 @@ This package provides functionality to:
 - Visualize directory structures as ASCII trees
 """
 
-from projectsummarizer.engine import (
-    build_tree,
-    render_ascii_tree,
-)
-
-from projectsummarizer.files.tree.node import FileSystemNode
-from projectsummarizer.files.tree.tree import FileSystemTree
-from projectsummarizer.files.discovery import (
-    FileDiscoverer,
-    IgnorePatternsHandler,
-    BinaryDetectorFactory,
-    BinaryDetectorProtocol,
-)
-from projectsummarizer.tokens import TokenCounter
-from projectsummarizer.contents.readers import (
-    ContentReaderRegistry,
-    BaseContentReader,
-    TextFileReader,
-    NotebookReader,
-)
-from projectsummarizer.contents.formatters import (
-    BaseFormatter,
-    StreamingTextFormatter,
-    XMLFormatter,
-    MarkdownFormatter,
-    create_formatter,
-)
-from projectsummarizer.plotting import TreePlotter
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from projectsummarizer.engine import (
+        build_tree,
+        render_ascii_tree,
+    )
+
+    from projectsummarizer.files.tree.node import FileSystemNode
+    from projectsummarizer.files.tree.tree import FileSystemTree
+    from projectsummarizer.files.discovery import (
+        FileDiscoverer,
+        IgnorePatternsHandler,
+        BinaryDetectorFactory,
+        BinaryDetectorProtocol,
+    )
+    from projectsummarizer.tokens import TokenCounter
+    from projectsummarizer.contents.readers import (
+        ContentReaderRegistry,
+        BaseContentReader,
+        TextFileReader,
+        NotebookReader,
+    )
+    from projectsummarizer.contents.formatters import (
+        BaseFormatter,
+        StreamingTextFormatter,
+        XMLFormatter,
+        MarkdownFormatter,
+        create_formatter,
+    )
+    from projectsummarizer.plotting import TreePlotter
+
+# Public names are imported on first access (PEP 562). Importing any submodule,
+# e.g. projectsummarizer.cli for a script's --help, runs this file first; the
+# engine pulls in every tokenizer backend, which takes seconds to import.
+_LAZY_IMPORTS = {
+    "build_tree": "projectsummarizer.engine",
+    "render_ascii_tree": "projectsummarizer.engine",
+    "FileSystemNode": "projectsummarizer.files.tree.node",
+    "FileSystemTree": "projectsummarizer.files.tree.tree",
+    "FileDiscoverer": "projectsummarizer.files.discovery",
+    "IgnorePatternsHandler": "projectsummarizer.files.discovery",
+    "BinaryDetectorFactory": "projectsummarizer.files.discovery",
+    "BinaryDetectorProtocol": "projectsummarizer.files.discovery",
+    "TokenCounter": "projectsummarizer.tokens",
+    "ContentReaderRegistry": "projectsummarizer.contents.readers",
+    "BaseContentReader": "projectsummarizer.contents.readers",
+    "TextFileReader": "projectsummarizer.contents.readers",
+    "NotebookReader": "projectsummarizer.contents.readers",
+    "BaseFormatter": "projectsummarizer.contents.formatters",
+    "StreamingTextFormatter": "projectsummarizer.contents.formatters",
+    "XMLFormatter": "projectsummarizer.contents.formatters",
+    "MarkdownFormatter": "projectsummarizer.contents.formatters",
+    "create_formatter": "projectsummarizer.contents.formatters",
+    "TreePlotter": "projectsummarizer.plotting",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # Resolve each name only once
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "0.1.0"
 
@@ -1,19 +1,29 @@
 """CLI argument configuration for ProjectSummarizer scripts."""
 
 from projectsummarizer.cli.args import (
+    FILTER_TYPES,
+    OUTPUT_FORMATS,
+    BASIC_SORT_KEYS,
+    DATE_SORT_KEYS,
     add_file_selection_args,
     add_ignore_logic_args,
     add_token_counting_args,
     add_sorting_args,
+    validate_sorting_args,
     add_date_tracking_args,
     add_format_args,
 )
 
 __all__ = [
+    "FILTER_TYPES",
+    "OUTPUT_FORMATS",
+    "BASIC_SORT_KEYS",
+    "DATE_SORT_KEYS",
     "add_file_selection_args",
     "add_ignore_logic_args",
     "add_token_counting_args",
     "add_sorting_args",
+    "validate_sorting_args",
     "add_date_tracking_args",
     "add_format_args",
 ]
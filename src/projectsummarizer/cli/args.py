@@ -9,6 +9,14 @@ Script-specific arguments should remain in their respective scripts.
 import argparse
 from typing import Optional
 
+# Values accepted by the shared arguments. Defined once so choices, validation
+# and help texts cannot drift apart between scripts.
+FILTER_TYPES = ("included", "removed", "all")
+OUTPUT_FORMATS = ("text", "xml", "markdown")
+# Sort keys other than these are token model names
+BASIC_SORT_KEYS = ("name", "size")
+DATE_SORT_KEYS = ("created", "modified")
+
 
 def add_file_selection_args(
     parser: argparse.ArgumentParser,
@@ -33,7 +41,7 @@ def add_file_selection_args(
     parser.add_argument(
         "--filter",
         type=str,
-        choices=["included", "removed", "all"],
+        choices=FILTER_TYPES,
         default="included",
         help="Which files to show: 'included' (default, after ignore patterns), "
              "'removed' (ignored files), or 'all' (no filtering)"
@@ -48,6 +56,14 @@ def add_file_selection_args(
              "None means unlimited depth (default)."
     )
 
+    parser.add_argument(
+        "--scan_workers",
+        type=int,
+        default=1,
+        help="Number of threads listing directories concurrently. "
+             "Speeds up network file systems (NFS, SMB); 1 (default) lists them one by one"
+    )
+
 
 def add_ignore_logic_args(parser: argparse.ArgumentParser) -> None:
     """Add ignore pattern and filtering arguments to parser.
@@ -101,6 +117,21 @@ def add_token_counting_args(parser: argparse.ArgumentParser) -> None:
              "and Google (e.g. 'gemini-1.5-pro-002') models."
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of threads reading files and counting tokens in parallel "
+             "(default: based on the number of CPUs)"
+    )
+
+    parser.add_argument(
+        "--no_token_cache",
+        action="store_true",
+        help="Do not reuse or store token counts of API-backed models (Anthropic) "
+             "in the persistent cache (~/.cache/projectsummarizer/tokens.sqlite)"
+    )
+
 
 def add_sorting_args(parser: argparse.ArgumentParser) -> None:
     """Add sorting arguments to parser.
@@ -121,6 +152,31 @@ def add_sorting_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def validate_sorting_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Check that --sort-by is compatible with the other parsed arguments.
+
+    Requires the sorting, token counting and date tracking argument groups.
+    Exits through parser.error() on an invalid combination.
+
+    Args:
+        parser: ArgumentParser the arguments were parsed with
+        args: Parsed arguments
+    """
+    if args.sort_by in DATE_SORT_KEYS:
+        # Date sorting requires --include-dates
+        if not args.include_dates:
+            parser.error(
+                f"When sorting by '{args.sort_by}', --include-dates must be enabled"
+            )
+    elif args.sort_by not in BASIC_SORT_KEYS:
+        # Treat as token model - must be in count_tokens
+        if not args.count_tokens or args.sort_by not in args.count_tokens:
+            parser.error(
+                f"When sorting by token model '{args.sort_by}', "
+                f"it must be included in --count_tokens"
+            )
+
+
 def add_format_args(parser: argparse.ArgumentParser) -> None:
     """Add output format arguments to parser.
 
@@ -130,7 +186,7 @@ def add_format_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--format",
         type=str,
-        choices=["text", "xml", "markdown"],
+        choices=OUTPUT_FORMATS,
         default="text",
         help="Output format: 'text' (default), 'xml' (recommended for LLMs, uses Anthropic's "
              "<documents>/<document>/<source>/<document_content> schema), or 'markdown'"
@@ -1,6 +1,45 @@
 """Abstract base class for all output formatters."""
 
+import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from typing import Optional, TextIO
+
+# Chunk size used when copying the streamed body behind the header
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Buffer size of the streamed body file. Formatters issue several small writes
+# per file; a large buffer turns them into few large write() system calls.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _append_file(source, destination) -> None:
+    """Append the whole content of source to destination.
+
+    Uses os.sendfile() where it works between regular files (Linux), so the
+    data is copied inside the kernel without passing through Python buffers;
+    falls back to a chunked copy elsewhere.
+
+    Args:
+        source: Binary file object to copy from (read from the start)
+        destination: Binary file object to append to at its current position
+    """
+    offset = 0
+    if hasattr(os, "sendfile"):
+        destination.flush()
+        try:
+            while True:
+                sent = os.sendfile(destination.fileno(), source.fileno(), offset, _COPY_CHUNK_SIZE)
+                if not sent:
+                    return
+                offset += sent
+        except OSError:
+            if offset:
+                raise
+            # Not supported for these files (e.g. macOS only sends to sockets)
+    source.seek(0)
+    shutil.copyfileobj(source, destination, _COPY_CHUNK_SIZE)
 
 
 class BaseFormatter(ABC):
@@ -9,9 +48,19 @@ class BaseFormatter(ABC):
     Formatters own the output file lifecycle: they open it, stream content
     via write_content() callbacks, prepend the tree structure via write_tree(),
     and close the file.
+
+    Content is streamed into a temporary body file in the system temp
+    directory, outside the project being summarized (the output itself often
+    sits inside it and must not pick up a randomly named file). The final
+    file is assembled once, header first, by copying the body behind it
+    (inside the kernel where possible), so prepending the tree never reads
+    the whole summary back into memory or rewrites it twice.
     """
 
     file_count: int = 0
+    output_path: str
+    output_file: Optional[TextIO] = None
+    _body_path: Optional[str] = None
 
     @abstractmethod
     def open(self) -> None:
@@ -47,6 +96,58 @@ class BaseFormatter(ABC):
         """
         ...
 
+    def _open_body(self) -> None:
+        """Open a temporary body file in the system temp directory as output_file.
+
+        The project is still being walked while the body is written, so the
+        body must not live in the output directory, which is usually inside it.
+        sendfile() copies between file systems, so assembling the output from
+        another file system costs nothing extra.
+        """
+        fd, self._body_path = tempfile.mkstemp(prefix=".summary-", suffix=".tmp")
+        self.output_file = open(fd, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE)
+
+    def _assemble_output(self, header: str, separator: str = "") -> None:
+        """Write header + body to output_path and keep appending to the result.
+
+        Args:
+            header: Text written before the streamed body
+            separator: Text written between header and body, only if the body is not empty
+        """
+        if not self.output_file:
+            raise RuntimeError("Cannot write tree: file is not open")
+        if not self._body_path:
+            raise RuntimeError("Cannot write tree: it was already written")
+
+        self.output_file.close()
+        if os.path.getsize(self._body_path):
+            with open(self.output_path, "wb") as out, open(self._body_path, "rb") as body:
+                out.write(header.encode("utf-8"))
+                if separator:
+                    out.write(separator.encode("utf-8"))
+                _append_file(body, out)
+        else:
+            # Nothing was streamed (e.g. structure-only output): the header is the whole file
+            with open(self.output_path, "wb") as out:
+                out.write(header.encode("utf-8"))
+        os.remove(self._body_path)
+        self._body_path = None
+
+        # Anything written after this point (e.g. closing tags) goes to the final file
+        self.output_file = open(self.output_path, "a", encoding="utf-8")
+
+    def _close_output(self, header: str = "") -> None:
+        """Close the output, assembling it first if write_tree() was never called.
+
+        Args:
+            header: Text that belongs before the body when no tree was written
+        """
+        if self.output_file and self._body_path:
+            self._assemble_output(header)
+        if self.output_file:
+            self.output_file.close()
+            self.output_file = None
+
     def __enter__(self):
         self.open()
         return self
@@ -1,11 +1,21 @@
 """Markdown formatter that outputs content as a structured Markdown document."""
 
-from pathlib import Path
-from typing import TextIO
+import os
 
 from projectsummarizer.contents.formatters.base import BaseFormatter
 
 
+def _language(relative_path: str) -> str:
+    """Return the code block language hint: the file extension without its dot.
+
+    Same result as Path(relative_path).suffix.lstrip("."), without building
+    a Path object for every file.
+    """
+    name = os.path.basename(relative_path)
+    index = name.rfind(".")
+    return name[index + 1:] if 0 < index < len(name) - 1 else ""
+
+
 class MarkdownFormatter(BaseFormatter):
     """Formats project content as a Markdown document.
 
@@ -21,18 +31,16 @@ class MarkdownFormatter(BaseFormatter):
         """
         self.output_path = output_path
         self.file_count = 0
-        self.output_file: TextIO = None
+        self.output_file = None
 
     def open(self) -> None:
         """Open the output file for writing."""
-        self.output_file = open(self.output_path, "w", encoding="utf-8")
+        self._open_body()
         self.file_count = 0
 
     def close(self) -> None:
         """Close the output file."""
-        if self.output_file:
-            self.output_file.close()
-            self.output_file = None
+        self._close_output()
 
     def write_content(self, relative_path: str, content: str, metadata: dict = None) -> None:
         """Write a single file as a Markdown section with a fenced code block.
@@ -46,21 +54,21 @@ class MarkdownFormatter(BaseFormatter):
             return
 
         self.file_count += 1
-        self.output_file.write(f"## {relative_path}\n\n")
+        # Everything before the content goes out in one write() call
+        header = f"## {relative_path}\n\n"
 
         if metadata:
             created = metadata.get("created")
             modified = metadata.get("modified")
             if created or modified:
-                self.output_file.write("---\n")
+                header += "---\n"
                 if created:
-                    self.output_file.write(f"created: {created}\n")
+                    header += f"created: {created}\n"
                 if modified:
-                    self.output_file.write(f"modified: {modified}\n")
-                self.output_file.write("---\n\n")
+                    header += f"modified: {modified}\n"
+                header += "---\n\n"
 
-        language = Path(relative_path).suffix.lstrip(".")
-        self.output_file.write(f"```{language}\n")
+        self.output_file.write(f"{header}```{_language(relative_path)}\n")
         self.output_file.write(content)
         self.output_file.write("\n```\n\n")
 
@@ -70,18 +78,4 @@ class MarkdownFormatter(BaseFormatter):
         Args:
             tree: ASCII tree representation of the project structure
         """
-        if not self.output_file:
-            raise RuntimeError("Cannot write tree: file is not open")
-
-        self.output_file.flush()
-
-        with open(self.output_path, "r", encoding="utf-8") as f:
-            current_content = f.read()
-
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write("# Project Structure\n\n")
-            f.write("```\n")
-            f.write(tree)
-            f.write("\n```\n\n")
-            if current_content:
-                f.write(current_content)
+        self._assemble_output(f"# Project Structure\n\n```\n{tree}\n```\n\n")
@@ -1,7 +1,5 @@
 """Streaming text formatter that writes output incrementally without loading all content in memory."""
 
-from typing import TextIO
-
 from projectsummarizer.contents.formatters.base import BaseFormatter
 
 
@@ -23,19 +21,20 @@ class StreamingTextFormatter(BaseFormatter):
         self.output_path = output_path
         self.delimiter = delimiter
         self.delimiter_replacement = delimiter_replacement
+        # Fence lines written around every file, built once
+        self._opening = f"{delimiter}\n"
+        self._closing = f"\n{delimiter}\n\n"
         self.file_count = 0
-        self.output_file: TextIO = None
+        self.output_file = None
 
     def open(self) -> None:
         """Open the output file for writing."""
-        self.output_file = open(self.output_path, "w", encoding="utf-8")
+        self._open_body()
         self.file_count = 0
 
     def close(self) -> None:
         """Close the output file."""
-        if self.output_file:
-            self.output_file.close()
-            self.output_file = None
+        self._close_output()
 
     def write_content(self, relative_path: str, content: str, metadata: dict = None) -> None:
         """Stream a single file's content to output.
@@ -50,24 +49,28 @@ class StreamingTextFormatter(BaseFormatter):
         if content and self.output_file:
             self.file_count += 1
 
-            self.output_file.write(f"## {relative_path}\n\n")
+            # Everything before the content goes out in one write() call
+            header = f"## {relative_path}\n\n"
 
             if metadata:
                 created = metadata.get("created")
                 modified = metadata.get("modified")
 
                 if created or modified:
-                    self.output_file.write("---\n")
+                    header += "---\n"
                     if created:
-                        self.output_file.write(f"created: {created}\n")
+                        header += f"created: {created}\n"
                     if modified:
-                        self.output_file.write(f"modified: {modified}\n")
-                    self.output_file.write("---\n")
+                        header += f"modified: {modified}\n"
+                    header += "---\n"
 
-            self.output_file.write(f"{self.delimiter}\n")
-            safe_content = content.replace(self.delimiter, self.delimiter_replacement)
-            self.output_file.write(safe_content)
-            self.output_file.write(f"\n{self.delimiter}\n\n")
+            self.output_file.write(header + self._opening)
+            # Probing for the delimiter's first character (memchr speed) skips the
+            # much slower substring search in the many files that lack it
+            if self.delimiter[:1] in content:
+                content = content.replace(self.delimiter, self.delimiter_replacement)
+            self.output_file.write(content)
+            self.output_file.write(self._closing)
 
     def write_tree(self, tree: str) -> None:
         """Prepend the project structure tree to the output.
@@ -75,15 +78,7 @@ class StreamingTextFormatter(BaseFormatter):
         Args:
             tree: ASCII tree representation of the project structure
         """
-        if not self.output_file:
-            raise RuntimeError("Cannot write tree: file is not open")
-
-        self.output_file.flush()
-
-        with open(self.output_path, "r", encoding="utf-8") as f:
-            current_content = f.read()
-
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write(f"Project Structure:\n{self.delimiter}\n{tree}\n{self.delimiter}\n")
-            if current_content:
-                f.write("\n" + current_content)
+        self._assemble_output(
+            f"Project Structure:\n{self.delimiter}\n{tree}\n{self.delimiter}\n",
+            separator="\n",
+        )
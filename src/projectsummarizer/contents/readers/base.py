@@ -1,15 +1,97 @@
 """Base content reader and registry."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional, Tuple
+import mmap
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for reading the rest of a file whose size is unknown or has changed
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Files larger than this are decoded straight from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def read_file_bytes(file_path: str, size_hint: Optional[int] = None) -> bytes:
+    """Read a whole file with as few system calls as possible.
+
+    When the size from an earlier stat() is known, the file is read with a single
+    read() of one byte more than expected. Getting exactly the expected size then
+    proves EOF, saving the fstat() and the final empty read() that a plain
+    read-to-end needs. If the file changed size in the meantime, the rest is read
+    in chunks.
+
+    Args:
+        file_path: Path to the file
+        size_hint: File size from an earlier stat(), if known
+
+    Returns:
+        File content
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if size_hint is not None:
+            data = os.read(fd, size_hint + 1)
+            if len(data) == size_hint:
+                return data
+            chunks = [data]
+        else:
+            chunks = []
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def read_file_text(file_path: str, size_hint: Optional[int] = None) -> str:
+    """Read a whole UTF-8 file as text.
+
+    Large files are memory-mapped and decoded directly from the mapping, so the
+    file content never exists as an intermediate bytes object next to the
+    decoded string. Smaller files are read with read_file_bytes().
+
+    Args:
+        file_path: Path to the file
+        size_hint: File size from an earlier stat(), if known
+
+    Returns:
+        Decoded file content
+
+    Raises:
+        OSError: If the file cannot be opened or read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    if size_hint is None or size_hint <= _MMAP_THRESHOLD:
+        return read_file_bytes(file_path, size_hint).decode("utf-8")
+
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except ValueError:  # File was truncated to zero bytes since the stat()
+            return ""
+        with mapped:
+            return str(mapped, "utf-8")
+    finally:
+        os.close(fd)
+
 
 class BaseContentReader(ABC):
     """Abstract base for file content extraction."""
+
+    # File extensions (with the dot, case-sensitive) outside of which can_read()
+    # is always False. Lets the registry skip the reader for other files; empty
+    # for readers that decide by other means.
+    extensions: Tuple[str, ...] = ()
     
     @abstractmethod
     def can_read(self, file_path: str, file_data: dict = None) -> bool:
@@ -27,10 +109,20 @@ class ContentReaderRegistry:
     
     def __init__(self):
         self.readers: List[BaseContentReader] = []
+        # Readers to try, in registration order: per declared extension, and
+        # for files with any other extension
+        self._readers_by_extension: Dict[str, List[BaseContentReader]] = {}
+        self._generic_readers: List[BaseContentReader] = []
     
     def register(self, reader: BaseContentReader):
         """Add a reader to the registry."""
         self.readers.append(reader)
+        extensions = {ext for r in self.readers for ext in r.extensions}
+        self._readers_by_extension = {
+            ext: [r for r in self.readers if not r.extensions or ext in r.extensions]
+            for ext in extensions
+        }
+        self._generic_readers = [r for r in self.readers if not r.extensions]
     
     def read(self, file_path: str, max_size: int = 5*1024*1024, file_data: dict = None) -> str:
         """Try readers in sequence until one successfully reads the file.
@@ -52,11 +144,17 @@ class ContentReaderRegistry:
                 if os.path.getsize(file_path) > max_size:
                     return ""
             except OSError as e:
-                logger.warning(f"Cannot access file {file_path}: {e}")
+                # Formatted lazily, only if the record is actually emitted
+                logger.warning("Cannot access file %s: %s", file_path, e)
                 return ""
         
-        # Try readers in sequence until one successfully reads the file
-        for reader in self.readers:
+        # Try readers in sequence until one successfully reads the file, skipping
+        # readers limited to other extensions without calling them
+        readers = self._generic_readers
+        dot = file_path.rfind(".")
+        if dot != -1:
+            readers = self._readers_by_extension.get(file_path[dot:], readers)
+        for reader in readers:
             if reader.can_read(file_path, file_data):
                 content = reader.read_content(file_path, max_size, file_data)
                 if content:  # If reader successfully read content, stop here
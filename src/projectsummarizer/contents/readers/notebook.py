@@ -1,27 +1,76 @@
 """Jupyter notebook content reader."""
 
-import nbformat
-from projectsummarizer.contents.readers.base import BaseContentReader
+import json
+from typing import List, Optional, Tuple
+
+from projectsummarizer.contents.readers.base import BaseContentReader, read_file_bytes
+
+# Try to import orjson (faster JSON parsing), but make it optional
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _parse_v4_cells(data: bytes) -> Optional[List[Tuple[str, str]]]:
+    """Extract (cell_type, source) of each cell straight from v4 notebook JSON.
+
+    nbformat.read() validates the whole notebook against its JSON schema, which
+    takes far longer than parsing it; only cell types and sources are needed.
+
+    Args:
+        data: Raw notebook file content
+
+    Returns:
+        List of (cell_type, source), or None if the notebook is not a
+        well-formed v4 notebook and has to go through nbformat
+    """
+    try:
+        nb = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        if nb.get("nbformat") != 4:
+            return None
+        cells = []
+        for cell in nb["cells"]:
+            source = cell.get("source", "")
+            if isinstance(source, list):  # Stored as a list of lines on disk
+                source = "".join(source)
+            cells.append((cell["cell_type"], source))
+        return cells
+    except (ValueError, TypeError, AttributeError, KeyError):
+        return None
 
 
 class NotebookReader(BaseContentReader):
     """Extracts code and markdown cells from Jupyter notebooks."""
-    
+
+    extensions = (".ipynb",)
+
     def can_read(self, file_path: str, file_data: dict = None) -> bool:
         """Check if this reader handles the file type."""
         return file_path.endswith('.ipynb')
-    
+
     def read_content(self, file_path: str, max_size: int, file_data: dict = None) -> str:
         """Extract text content from notebook, return empty if too large/unreadable."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                nb = nbformat.read(f, as_version=4)
-
-            content = ""
-            for cell in nb.cells:
-                if cell.cell_type in ['code', 'markdown']:
-                    if cell.source:
-                        content += f"# {cell.cell_type.capitalize()} cell\n{cell.source}\n\n"
-            return content
+            size_hint = file_data.get("size") if file_data else None
+            data = read_file_bytes(file_path, size_hint)
+
+            cells = _parse_v4_cells(data)
+            if cells is None:
+                # Older formats are converted (and odd files validated) by nbformat,
+                # imported only here since it takes longer to import than the CLI
+                # takes to start up otherwise
+                import nbformat
+
+                nb = nbformat.reads(data.decode("utf-8"), as_version=4)
+                cells = [(cell.cell_type, cell.source) for cell in nb.cells]
+
+            parts = []
+            for cell_type, source in cells:
+                if cell_type in ['code', 'markdown']:
+                    if source:
+                        parts.append(f"# {cell_type.capitalize()} cell\n{source}\n\n")
+            return "".join(parts)
         except (OSError, UnicodeDecodeError, Exception):
             return ""
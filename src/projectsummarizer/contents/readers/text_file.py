@@ -1,6 +1,6 @@
 """Text file content reader."""
 
-from projectsummarizer.contents.readers.base import BaseContentReader
+from projectsummarizer.contents.readers.base import BaseContentReader, read_file_text
 
 
 class TextFileReader(BaseContentReader):
@@ -17,8 +17,14 @@ class TextFileReader(BaseContentReader):
     def read_content(self, file_path: str, max_size: int, file_data: dict = None) -> str:
         """Extract text content from file, return empty if too large/unreadable."""
         try:
-            with open(file_path, "r", encoding='utf-8') as infile:
-                content = infile.read()
-            return content
+            # Read raw bytes in one go (one read() when the size is known from
+            # discovery, a memory map for large files) and decode once, instead
+            # of going through the incremental text-mode decoder
+            size_hint = file_data.get("size") if file_data else None
+            content = read_file_text(file_path, size_hint)
         except (OSError, UnicodeDecodeError):
             return ""
+        # Keep text mode's universal newline translation
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
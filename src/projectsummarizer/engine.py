@@ -2,7 +2,7 @@ from typing import List, Optional, Callable
 from projectsummarizer.files.tree.tree import FileSystemTree
 from projectsummarizer.files.tree.node import FileSystemNode
 from projectsummarizer.files.discovery import FileDiscoverer
-from projectsummarizer.tokens import TokenCounter
+from projectsummarizer.tokens import TokenCounter, TokenCountCache
 from projectsummarizer.plotting import TreePlotter
 
 
@@ -18,11 +18,16 @@ def build_tree(
     content_processor: Optional[Callable[[str, str], None]] = None,
     level: Optional[int] = None,
     include_dates: bool = False,
+    token_cache: bool = True,
+    workers: Optional[int] = None,
+    scan_workers: int = 1,
 ) -> FileSystemNode:
     """Build a file tree from directory with optional token counting and content streaming.
 
     This is the unified function for building file trees. It reads each file exactly once,
-    making it memory-efficient for large projects.
+    making it memory-efficient for large projects. Files are only read at all when
+    content_processor or token_models are given; otherwise (e.g. a structure-only
+    summary) just the directory listing and file sizes are gathered.
 
     Args:
         directory: Root directory to scan
@@ -35,6 +40,12 @@ def build_tree(
         content_processor: Optional callback function(relative_path, content) for streaming content
         level: Descend only level directories deep (root is level 0). None means unlimited (default)
         include_dates: Whether to include file creation and modification dates (from git or filesystem)
+        token_cache: Whether to reuse API-backed token counts stored by previous runs
+                    (persistent cache in ~/.cache/projectsummarizer, keyed by content hash)
+        workers: Number of threads that stat, read, date and count tokens for files while
+                 the walk and content streaming go on. None picks a default from the CPU count
+        scan_workers: Number of threads listing directories ahead of the walk. Helps on
+                      network file systems (NFS, SMB); 1 (default) lists them inline
 
     Returns:
         root_node: Root of the file tree with aggregated metrics
@@ -54,7 +65,8 @@ def build_tree(
     # Set up token counter if models provided
     token_counter = None
     if token_models:
-        token_counter = TokenCounter(token_models)
+        cache = TokenCountCache() if token_cache else None
+        token_counter = TokenCounter(token_models, cache=cache)
 
     # Create discoverer
     discoverer = FileDiscoverer(
@@ -66,7 +78,9 @@ def build_tree(
         token_counter=token_counter,
         filter_type=filter_type,
         level=level,
-        include_dates=include_dates
+        include_dates=include_dates,
+        workers=workers,
+        scan_workers=scan_workers
     )
 
     # Discover files and optionally process content in one pass
@@ -1,7 +1,10 @@
-"""Common binary file extensions for fallback binary detection.
+"""Common binary and text file extensions for fallback binary detection.
 
-This blacklist is used when libmagic is not available to identify
-known binary file formats by their extensions.
+These lists are used when libmagic is not available: the blacklist identifies
+known binary file formats by their extensions without reading the files, and
+the whitelist known text formats, whose files only get a small sample checked.
+Extensions shared with binary formats (e.g. .ts, also MPEG transport streams)
+are left out of the whitelist.
 """
 
 BINARY_EXTENSIONS = {
@@ -36,3 +39,26 @@ BINARY_EXTENSIONS = {
     '.parquet', '.avro', '.orc',
     '.wasm', '.bc',
 }
+
+TEXT_EXTENSIONS = {
+    # Plain text and documentation
+    '.txt', '.md', '.rst', '.adoc', '.tex', '.csv', '.tsv', '.log',
+
+    # Configuration and data
+    '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.xml', '.env',
+    '.properties', '.lock',
+
+    # Web
+    '.html', '.htm', '.css', '.scss', '.sass', '.less', '.js', '.mjs', '.cjs',
+    '.jsx', '.tsx', '.vue', '.svelte',
+
+    # Source code
+    '.py', '.pyi', '.pyx', '.c', '.h', '.cc', '.cpp', '.cxx', '.hpp', '.hh',
+    '.cs', '.java', '.kt', '.kts', '.scala', '.go', '.rs', '.rb', '.php',
+    '.swift', '.m', '.mm', '.lua', '.pl', '.pm', '.r', '.jl', '.dart',
+    '.ex', '.exs', '.erl', '.hs', '.clj', '.elm', '.fs', '.ml', '.sql',
+
+    # Scripts and build files
+    '.sh', '.bash', '.zsh', '.fish', '.ps1', '.bat', '.cmd', '.mk', '.cmake',
+    '.gradle', '.dockerfile',
+}
@@ -1,15 +1,33 @@
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
 import magic
 
+# Number of distinct samples whose classification is remembered
+_CLASSIFICATION_CACHE_SIZE = 4096
+
 
 class BinaryLibmagicDetector:
     """Content-based binary detector using libmagic.
 
     Relies on libmagic for accurate binary detection.
+
+    Loading the magic database is slow, so the two libmagic cookies are created
+    once and shared by all instances (python-magic serializes calls on a cookie
+    with a lock). Classifications are remembered by a digest of the sample, so
+    identical files (empty __init__.py files, copies of a license, generated
+    boilerplate) are passed to libmagic once.
     """
 
+    _shared_cookies: Optional[Tuple["magic.Magic", "magic.Magic"]] = None
+
     def __init__(self) -> None:
-        self._magic_mime = magic.Magic(mime=True)
-        self._magic_enc = magic.Magic(mime_encoding=True)
+        cls = type(self)
+        if cls._shared_cookies is None:
+            cls._shared_cookies = (magic.Magic(mime=True), magic.Magic(mime_encoding=True))
+        self._magic_mime, self._magic_enc = cls._shared_cookies
+        self._classified: "OrderedDict[bytes, bool]" = OrderedDict()
 
     def is_binary(self, path: str, sample_bytes: int = 65536) -> bool:
         """Return True if the file at `path` should be treated as binary."""
@@ -22,10 +40,24 @@ class BinaryLibmagicDetector:
         return self._is_binary_data(head)
 
     def _is_binary_data(self, data: bytes) -> bool:
-        """Check if data should be treated as binary using libmagic."""
+        """Check if data should be treated as binary, reusing earlier results for the same data."""
         if not data:
             return False
 
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        is_binary = self._classified.get(key)
+        if is_binary is not None:
+            self._classified.move_to_end(key)
+            return is_binary
+
+        is_binary = self._classify(data)
+        self._classified[key] = is_binary
+        if len(self._classified) > _CLASSIFICATION_CACHE_SIZE:
+            self._classified.popitem(last=False)
+        return is_binary
+
+    def _classify(self, data: bytes) -> bool:
+        """Check if data should be treated as binary using libmagic."""
         try:
             # Check encoding first
             enc = self._magic_enc.from_buffer(data)
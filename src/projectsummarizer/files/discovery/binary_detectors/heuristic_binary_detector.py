@@ -1,17 +1,35 @@
 """Heuristic-based binary file detector as fallback when libmagic is unavailable."""
 
 import os
-from projectsummarizer.files.discovery.binary_detectors.binary_extensions import BINARY_EXTENSIONS
+from projectsummarizer.files.discovery.binary_detectors.binary_extensions import BINARY_EXTENSIONS, TEXT_EXTENSIONS
+
+# Bytes sampled from files whose extension says they are text: enough to catch
+# UTF-16/UTF-32 text or binary data behind a text extension
+_TEXT_SAMPLE_BYTES = 8192
+
+# Byte order marks of UTF-16 and UTF-32 (which starts like UTF-16). The readers
+# only decode UTF-8, so such files are binary to this project.
+_WIDE_BOMS = (b"\xff\xfe", b"\xfe\xff", b"\x00\x00\xfe\xff")
+
+# Bytes that do not count as printable: control characters other than tab,
+# line feed and carriage return, and DEL
+_NON_PRINTABLE = bytes(
+    byte for byte in range(256)
+    if not ((32 <= byte <= 126) or byte in (9, 10, 13) or byte >= 128)
+)
 
 
 class HeuristicBinaryDetector:
     """Heuristic-based binary detector without libmagic dependency.
 
     Uses multiple heuristics to detect binary files:
-    1. Check file extension against known binary formats (blacklist)
+    1. Check file extension against known binary formats (blacklist), which
+       decides without reading the file, and known text formats (whitelist),
+       which only get the remaining steps run on a small sample
     2. Check for null bytes (strong indicator of binary)
-    3. Try UTF-8 decoding
-    4. Analyze ratio of printable to non-printable characters
+    3. Check for UTF-16/UTF-32 byte order marks
+    4. Try UTF-8 decoding
+    5. Analyze ratio of printable to non-printable characters
 
     When uncertain, prefers to treat files as text (false negatives over false positives).
     This is appropriate for a project summarizer where including questionable content
@@ -20,9 +38,18 @@ class HeuristicBinaryDetector:
 
     def __init__(self) -> None:
         self._binary_extensions = BINARY_EXTENSIONS
+        self._text_extensions = TEXT_EXTENSIONS
 
     def is_binary(self, path: str, sample_bytes: int = 65536) -> bool:
         """Return True if the file at `path` should be treated as binary."""
+        # Known binary extensions are decided without opening the file
+        ext = self._extension(path)
+        if ext in self._binary_extensions:
+            return True
+        # Known text extensions only get their start checked
+        if ext in self._text_extensions:
+            sample_bytes = min(sample_bytes, _TEXT_SAMPLE_BYTES)
+
         try:
             with open(path, "rb", buffering=0) as f:
                 head = f.read(sample_bytes)
@@ -30,25 +57,29 @@ class HeuristicBinaryDetector:
             # If we can't read the file, treat it as binary (conservative)
             return True
 
-        return self._is_binary_data(head, path)
+        return self._is_binary_data(head)
 
-    def _is_binary_data(self, data: bytes, path: str = "") -> bool:
+    @staticmethod
+    def _has_binary_markers(data: bytes) -> bool:
+        """Check for null bytes or a UTF-16/UTF-32 byte order mark."""
+        return b"\x00" in data or data.startswith(_WIDE_BOMS)
+
+    @staticmethod
+    def _extension(path: str) -> str:
+        """Return the lowercase file extension, with its dot."""
+        return os.path.splitext(path)[1].lower()
+
+    def _is_binary_data(self, data: bytes) -> bool:
         """Check if data should be treated as binary using heuristics.
 
         When uncertain, prefers to treat files as text (false negatives over false positives).
         """
-        # Check file extension against blacklist
-        if path:
-            _, ext = os.path.splitext(path)
-            if ext.lower() in self._binary_extensions:
-                return True
-
         # Empty data is not binary
         if not data:
             return False
 
-        # Check for null bytes - strong indicator of binary
-        if b'\x00' in data:
+        # Check for null bytes - strong indicator of binary - and wide encodings
+        if self._has_binary_markers(data):
             return True
 
         # Try to decode as UTF-8
@@ -60,17 +91,8 @@ class HeuristicBinaryDetector:
             # Failed UTF-8 decoding, check further
             pass
 
-        # Try other common text encodings
-        for encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
-            try:
-                data.decode(encoding)
-                # Check if content looks like text
-                if self._looks_like_text(data):
-                    return False
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        # Analyze character distribution
+        # Analyze character distribution. Decoding with single-byte encodings
+        # (latin-1 and the like) proves nothing: they accept nearly any byte.
         if self._looks_like_text(data):
             return False
 
@@ -86,14 +108,11 @@ class HeuristicBinaryDetector:
         if not data:
             return True
 
-        # Count printable vs non-printable characters
-        printable = 0
+        # Count printable characters: printable ASCII (32-126), common whitespace
+        # and high-bit chars. Deleting the others with bytes.translate() counts
+        # them in C instead of looping over every byte in Python.
         total = len(data)
-
-        for byte in data:
-            # Printable ASCII (32-126), common whitespace (9-13), and high-bit chars
-            if (32 <= byte <= 126) or byte in (9, 10, 13) or byte >= 128:
-                printable += 1
+        printable = len(data.translate(None, _NON_PRINTABLE))
 
         # If more than 70% of characters are printable, consider it text
         # This threshold is intentionally low to prefer false negatives
@@ -102,18 +102,22 @@ class DateTimeMixin:
             pass
         return None
 
-    def _get_filesystem_dates(self, file_path: str) -> Tuple[Optional[str], str]:
+    def _get_filesystem_dates(
+        self, file_path: str, stat_info: Optional[os.stat_result] = None
+    ) -> Tuple[Optional[str], str]:
         """Get file dates from filesystem as fallback.
 
         Args:
             file_path: Absolute path to the file
+            stat_info: Already known stat result for the file (skips the stat call)
 
         Returns:
             Tuple of (created_date, modified_date) in YYYY-MM-DD format
             Created date may be None if not available
         """
         try:
-            stat_info = os.stat(file_path)
+            if stat_info is None:
+                stat_info = os.stat(file_path)
 
             # Modified date (always available)
             modified = datetime.fromtimestamp(stat_info.st_mtime).strftime('%Y-%m-%d')
@@ -132,13 +136,16 @@ class DateTimeMixin:
             # If we can't get filesystem dates, return None
             return (None, None)
 
-    def _get_file_dates(self, full_path: str) -> Tuple[Optional[str], Optional[str]]:
+    def _get_file_dates(
+        self, full_path: str, stat_info: Optional[os.stat_result] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
         """Get file creation and modification dates.
 
         Tries git first, falls back to filesystem.
 
         Args:
             full_path: Absolute path to the file
+            stat_info: Already known stat result for the file, used by the filesystem fallback
 
         Returns:
             Tuple of (created_date, modified_date) in YYYY-MM-DD format
@@ -154,7 +161,7 @@ class DateTimeMixin:
 
         # Fallback to filesystem if git didn't provide dates
         if created is None or modified is None:
-            fs_created, fs_modified = self._get_filesystem_dates(full_path)
+            fs_created, fs_modified = self._get_filesystem_dates(full_path, stat_info)
             if created is None:
                 created = fs_created
             if modified is None:
@@ -1,11 +1,58 @@
 import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, TYPE_CHECKING
+from typing import Deque, Dict, Iterator, List, Optional, Callable, Tuple, TYPE_CHECKING
 from projectsummarizer.files.discovery.ignore import IgnorePatternsHandler
 from projectsummarizer.files.discovery.binary_detectors import BinaryDetectorProtocol
 from projectsummarizer.files.discovery.discoverer.date_time_mixin import DateTimeMixin
 from projectsummarizer.contents.readers import ContentReaderRegistry, NotebookReader, BinaryFileReader, TextFileReader
 
+# Contents read ahead of the content processor are kept to about this many bytes
+_READ_AHEAD_BYTES = 64 * 1024 * 1024
+
+
+class _ReadAheadBudget:
+    """Limits the bytes of file content read ahead of the consumer.
+
+    Batches are numbered in submission order and consumed in that order. A
+    worker waits before reading a batch while the budget is used up, unless it
+    is the oldest batch not yet consumed: that is the one the consumer waits
+    for, so it always proceeds and the pipeline cannot deadlock.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self.oldest = 0
+        self._condition = threading.Condition()
+
+    def reserve(self, batch: int, size: int) -> None:
+        """Take size bytes for a batch, waiting while they are not available."""
+        with self._condition:
+            while self.used + size > self.limit and batch != self.oldest:
+                self._condition.wait()
+            self.used += size
+
+    def release(self, size: int, oldest: int) -> None:
+        """Return size bytes after their content was consumed.
+
+        Args:
+            size: Bytes to return
+            oldest: Number of the oldest batch that is not fully consumed yet
+        """
+        with self._condition:
+            self.used -= size
+            self.oldest = oldest
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Stop limiting, so that no worker is left waiting on shutdown."""
+        with self._condition:
+            self.limit = float("inf")
+            self._condition.notify_all()
+
 
 class FileDiscoverer(DateTimeMixin):
     """Discovers files and gathers their metadata from a directory tree.
@@ -41,13 +88,25 @@ class FileDiscoverer(DateTimeMixin):
         token_counter = None,
         filter_type: str = "included",
         level: Optional[int] = None,
-        include_dates: bool = False
+        include_dates: bool = False,
+        workers: Optional[int] = None,
+        batch_size: int = 8,
+        prune_ignored_dirs: bool = True,
+        scan_workers: int = 1
     ) -> None:
         self.root = Path(root)
         self.token_counter = token_counter
+        self.workers = workers
+        self.batch_size = max(1, batch_size)
         self.filter_type = filter_type
         self.level = level
         self.include_dates = include_dates
+        # Ignored directories can only be skipped when ignored files are not reported,
+        # and not with include_binary: binary files bypass the ignore patterns
+        self.prune_ignored_dirs = prune_ignored_dirs and filter_type == "included" and not include_binary
+        # Directory listings are fetched ahead by this many threads (1 lists inline).
+        # Worth it on network file systems; on a local disk the page cache wins.
+        self.scan_workers = max(1, scan_workers)
 
         # Check if we're in a git repository
         self._is_git_repo_cached = None
@@ -75,11 +134,19 @@ class FileDiscoverer(DateTimeMixin):
         This method reads each file exactly once and allows streaming processing
         of file contents without storing all content in memory.
 
+        Discovery runs as a pipeline: the walk and ignore checks run on the
+        calling thread, stat, reading and token counting of the following files
+        run on a thread pool, and the content processor is called on the calling
+        thread, one file at a time and in discovery order. At most
+        2 * workers * batch_size files are in flight, and their content read
+        ahead of the content processor is kept to about 64 MiB, which bounds
+        memory even when many files are large.
+
         Args:
             content_processor: Optional callback function(relative_path, content, metadata)
                              called for each non-binary file after reading.
                              metadata dict contains: size, is_binary, flags, tokens, created, modified
-                             If None, files are still read for token counting if token_counter is set.
+                             If None, files are only read for token counting if token_counter is set.
 
         Returns:
             Dictionary mapping relative paths to file metadata containing:
@@ -105,19 +172,50 @@ class FileDiscoverer(DateTimeMixin):
             files_data = discoverer.discover(write_content)
         """
         files_data: Dict[str, Dict] = {}
-        for current_directory, _, files in os.walk(self.root, topdown=True):
-            for filename in files:
-                relative_path = (Path(current_directory) / filename).relative_to(self.root).as_posix()
-                full_path = (Path(current_directory) / filename).as_posix()
-
-                # Check level limit if specified
-                if self.level is not None:
-                    # Calculate level by counting path separators
-                    # Root directory files have level 0
-                    depth = len(Path(relative_path).parts) - 1
-                    if depth > self.level:
-                        continue
 
+        # Stat, reading, date lookup (git runs a subprocess per file) and token
+        # counting are the expensive per-file steps. They block on I/O, subprocesses or the
+        # network, or run in native tokenizers that release the GIL, so they run on
+        # a thread pool in batches while the walk and the ignore checks go on.
+        # Files are finished strictly in discovery order, and only a bounded number
+        # of them is held in memory.
+        workers = self.workers or min(32, (os.cpu_count() or 1) + 4)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        max_pending = 2 * workers * self.batch_size
+        # Entries: [relative_path, full_path, dir_entry, file_data, (batch_future, index, batch_number)]
+        pending: Deque[list] = deque()
+        batch: List[list] = []  # Pending entries not yet submitted to the pool
+        batch_count = 0
+        # Files filtered out above are never read or counted; files that are kept
+        # are only read when something consumes their content
+        read_content = content_processor is not None or self.token_counter is not None
+        budget = _ReadAheadBudget(_READ_AHEAD_BYTES) if read_content else None
+
+        def submit_batch() -> None:
+            nonlocal batch_count
+            future = executor.submit(
+                self._process_files, [entry[1:4] for entry in batch], read_content,
+                (lambda size, number=batch_count: budget.reserve(number, size)) if budget else None,
+            )
+            for index, entry in enumerate(batch):
+                entry[4] = (future, index, batch_count)
+            batch_count += 1
+            batch.clear()
+
+        def finish_oldest() -> None:
+            # The oldest file may still be waiting in a partially filled batch
+            if batch and batch[0] is pending[0]:
+                submit_batch()
+            relative_path, _, _, file_data, (future, index, _) = pending.popleft()
+            results = future.result()
+            result, results[index] = results[index], None  # Drop the content once consumed
+            self._finish_file(relative_path, file_data, result, content_processor, files_data)
+            if budget:
+                oldest = pending[0][4][2] if pending and pending[0][4] else batch_count
+                budget.release(file_data["size"], oldest)
+
+        try:
+            for relative_path, full_path, entry in self._walk():
                 # Use centralized ignore logic
                 ignore_data = self.ignore_handler.is_ignored(relative_path, full_path)
 
@@ -126,16 +224,10 @@ class FileDiscoverer(DateTimeMixin):
                 if not should_include:
                     continue
 
-                # Get file size
-                try:
-                    size = os.path.getsize(full_path)
-                except OSError:
-                    size = 0
-
-                # Prepare file data
+                # Prepare file data (size is filled in by the worker that stats the file)
                 file_data = {
                     "is_binary": ignore_data["is_binary"],
-                    "size": size,
+                    "size": 0,
                     "flags": set()
                 }
 
@@ -143,32 +235,194 @@ class FileDiscoverer(DateTimeMixin):
                 if ignore_data["is_binary"]:
                     file_data["flags"].add("binary")
 
-                # Read file using the content reader registry
-                # This properly handles notebooks, binary files, and text files
-                content = self.content_registry.read(full_path, file_data=file_data)
+                pending_entry = [relative_path, full_path, entry, file_data, None]
+                pending.append(pending_entry)
+                batch.append(pending_entry)
+                if len(batch) >= self.batch_size:
+                    submit_batch()
 
-                # Add token counts if token_counter is provided and content was read
-                if self.token_counter and content:
-                    tokens = self.token_counter.count_tokens(content)
-                    file_data["tokens"] = tokens
-                else:
-                    file_data["tokens"] = {}
+                while len(pending) > max_pending:
+                    finish_oldest()
 
-                # Add file dates if requested
-                if self.include_dates:
-                    created, modified = self._get_file_dates(full_path)
-                    if created:
-                        file_data["created"] = created
-                    if modified:
-                        file_data["modified"] = modified
+            while pending:
+                finish_oldest()
+        finally:
+            if budget:
+                budget.close()
+            executor.shutdown(wait=True, cancel_futures=True)
 
-                # Call content processor if provided and content was read
-                if content_processor and content:
-                    content_processor(relative_path, content, file_data)
+        return files_data
 
-                files_data[relative_path] = file_data
+    def _process_files(
+        self,
+        files: List[Tuple[str, os.DirEntry, Dict]],
+        read_content: bool = True,
+        reserve: Optional[Callable[[int], None]] = None,
+    ) -> List[Tuple[str, Dict[str, int], Tuple[Optional[str], Optional[str]]]]:
+        """Stat, read, date and count tokens for a batch of files (runs on a worker thread).
 
-        return files_data
+        Stat calls of a batch overlap with those of other batches, which hides
+        their latency on cold caches and network file systems.
+
+        Args:
+            files: (full_path, dir_entry, file_data) of each file; file_data["size"] is set here
+            read_content: Whether to read the files (content is "" otherwise)
+            reserve: Called with the total size of the batch before it is read;
+                may block to limit how much content is read ahead
+
+        Returns:
+            (content, tokens, (created, modified)) of each file, in the same order
+        """
+        # Get file sizes (DirEntry caches the stat result for the date lookup below)
+        stats: List[Optional[os.stat_result]] = []
+        for _, entry, file_data in files:
+            try:
+                stat_info = entry.stat()
+                file_data["size"] = stat_info.st_size
+            except OSError:
+                stat_info = None
+            stats.append(stat_info)
+
+        # Read files using the content reader registry
+        # This properly handles notebooks, binary files, and text files
+        contents = [""] * len(files)
+        if read_content:
+            if reserve:
+                reserve(sum(file_data["size"] for _, _, file_data in files))
+            # Read in inode order, which roughly follows on-disk placement on most
+            # file systems and cuts seeking on cold caches and rotational disks.
+            # Files that could not be stat()ed are not tried again, and empty text
+            # files (e.g. __init__.py) are known to have no content without opening
+            # them; binary files are still passed on for their placeholder.
+            order = sorted(
+                (
+                    index for index, stat_info in enumerate(stats)
+                    if stat_info and (stat_info.st_size or files[index][2].get("is_binary"))
+                ),
+                key=lambda index: stats[index].st_ino,
+            )
+            for index in order:
+                full_path, _, file_data = files[index]
+                contents[index] = self.content_registry.read(full_path, file_data=file_data)
+
+        # Count tokens for the files whose content was read, in one batch
+        tokens: List[Dict[str, int]] = [{} for _ in files]
+        if self.token_counter:
+            read = [index for index, content in enumerate(contents) if content]
+            if read:
+                counts = self.token_counter.count_tokens_batch([contents[index] for index in read])
+                for index, file_tokens in zip(read, counts):
+                    tokens[index] = file_tokens
+
+        dates = [
+            self._get_file_dates(full_path, stat_info) if self.include_dates else (None, None)
+            for (full_path, _, _), stat_info in zip(files, stats)
+        ]
+
+        return list(zip(contents, tokens, dates))
+
+    def _finish_file(
+        self,
+        relative_path: str,
+        file_data: Dict,
+        result: Tuple[str, Dict[str, int], Tuple[Optional[str], Optional[str]]],
+        content_processor: Optional[Callable[[str, str, dict], None]],
+        files_data: Dict[str, Dict],
+    ) -> None:
+        """Complete a file's metadata, pass it to the content processor and record it."""
+        content, tokens, (created, modified) = result
+
+        # Add token counts (empty if they were not requested or no content was read)
+        file_data["tokens"] = tokens
+
+        # Add file dates if requested
+        if created:
+            file_data["created"] = created
+        if modified:
+            file_data["modified"] = modified
+
+        # Call content processor if provided and content was read
+        if content_processor and content:
+            content_processor(relative_path, content, file_data)
+
+        files_data[relative_path] = file_data
+
+    @staticmethod
+    def _list_directory(full_dir: str) -> Optional[List[os.DirEntry]]:
+        """Read a directory's entries, or return None if it cannot be listed."""
+        try:
+            with os.scandir(full_dir) as it:
+                return list(it)
+        except OSError:
+            return None
+
+    def _walk(self) -> Iterator[Tuple[str, str, os.DirEntry]]:
+        """Walk the directory tree and yield (relative_path, full_path, entry) for each file.
+
+        Uses os.scandir so directory-ness comes from the readdir result instead of
+        an extra stat() per entry, full paths come from DirEntry.path, and relative
+        paths are built by appending names to the parent's prefix rather than calling
+        relative_to() per file. No Path objects are created per entry.
+
+        With scan_workers > 1, the listings of a directory's subdirectories are
+        requested from a thread pool as soon as they are known, so on slow or
+        network file systems several readdir calls are in flight while earlier
+        directories are processed.
+
+        Traversal order is deterministic: files of a directory first, then its
+        subdirectories, both sorted by name. Symlinked directories are not followed
+        (same as os.walk's default). Directories deeper than the level limit, and
+        ignored directories when prune_ignored_dirs is active, are never listed.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.scan_workers) if self.scan_workers > 1 else None
+
+        def request_listing(full_dir: str):
+            if executor is None:
+                return None
+            return executor.submit(self._list_directory, full_dir)
+
+        root_path = self.root.as_posix()
+        # Stack of (relative_dir, full_dir, depth_of_files_inside, listing_future)
+        stack: List[Tuple[str, str, int, Optional[Future]]] = [("", root_path, 0, None)]
+
+        try:
+            while stack:
+                rel_dir, full_dir, depth, listing = stack.pop()
+                entries = listing.result() if listing is not None else self._list_directory(full_dir)
+                if entries is None:
+                    continue
+                entries.sort(key=lambda entry: entry.name)
+
+                rel_prefix = f"{rel_dir}/" if rel_dir else ""
+                subdirs: List[Tuple[str, str, int, Optional[Future]]] = []
+
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        # Only descend if files inside would still be within the level limit
+                        if entry.is_symlink() or (self.level is not None and depth + 1 > self.level):
+                            continue
+                        rel_subdir = rel_prefix + entry.name
+                        # Never list directories whose whole content is ignored (.git, node_modules, ...)
+                        if self.prune_ignored_dirs and self.ignore_handler.should_skip_dir(rel_subdir):
+                            continue
+                        subdirs.append((rel_subdir, entry.path, depth + 1, request_listing(entry.path)))
+                        continue
+
+                    # Check level limit if specified (root directory files have level 0)
+                    if self.level is not None and depth > self.level:
+                        continue
+
+                    yield rel_prefix + entry.name, entry.path, entry
+
+                stack.extend(reversed(subdirs))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
     def should_include_file(self, is_ignored: bool) -> bool:
         """Determine if a file should be included based on filter type."""
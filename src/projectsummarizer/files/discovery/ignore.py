@@ -1,13 +1,160 @@
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Dict, Set, Optional
+from typing import Iterable, List, Dict, Set, Optional, Tuple
 from collections import defaultdict
 from pathspec import PathSpec
+from pathspec.patterns import GitWildMatchPattern
 from projectsummarizer.files.discovery.binary_detectors import (
     BinaryDetectorFactory,
     BinaryDetectorProtocol,
 )
 
 
+# pathspec names a capture group in every compiled pattern; the names collide
+# once the patterns are joined into one alternation, so they are made anonymous.
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+
+def _compile_union(patterns: List) -> Optional[re.Pattern]:
+    """Combine compiled pathspec patterns into a single regex.
+
+    The union matches a path if and only if at least one pattern (positive or
+    negation) matches it, so a failed match proves no pattern is relevant.
+    Each alternative is wrapped in a group named ``p<index>``; alternatives are
+    tried in order, so ``match.lastgroup`` names the first matching pattern and
+    every pattern before it is known not to match.
+
+    Args:
+        patterns: Active compiled patterns, in precedence order
+
+    Returns:
+        Compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        f"(?P<p{index}>{_NAMED_GROUP.sub('(?:', p.regex.pattern)})"
+        for index, p in enumerate(patterns)
+    ))
+
+
+# Characters that make a gitwildmatch pattern more than a plain file or directory name
+_GLOB_CHARS = frozenset("*?[\\/")
+
+
+def _literal_fast_path(pattern_obj) -> Tuple[Optional[str], Optional[str]]:
+    """Classify a compiled pattern that can be matched without its regex.
+
+    A slash-free literal such as ``.git`` or ``node_modules`` matches a path
+    exactly when one of its components equals the name; a slash-free ``*.ext``
+    matches when one of its components ends with ``.ext``. Everything else
+    needs the regex.
+
+    Args:
+        pattern_obj: Compiled pathspec pattern
+
+    Returns:
+        Tuple of (literal_name, literal_suffix); both None if the regex is needed
+    """
+    body = str(pattern_obj.pattern)
+    if pattern_obj.include is False:
+        body = body[1:]
+    if not body or body in (".", ".."):
+        return None, None
+    if not _GLOB_CHARS.intersection(body):
+        return body, None
+    if body[0] == "*" and len(body) > 1 and not _GLOB_CHARS.intersection(body[1:]):
+        return None, body[1:]
+    return None, None
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(line: str) -> GitWildMatchPattern:
+    """Compile a single gitwildmatch pattern line.
+
+    Cached per process: the pattern set is recompiled into a PathSpec every time
+    another .gitignore is found during the walk, and the default, user and
+    already loaded .gitignore patterns are the same lines each time.
+
+    Args:
+        line: Pattern line (with directory prefix for nested .gitignore files)
+
+    Returns:
+        Compiled pattern
+    """
+    return GitWildMatchPattern(line)
+
+
+@lru_cache(maxsize=None)
+def _parse_ignore_file(path: str, mtime_ns: int, size: int, inode: int) -> Tuple[str, ...]:
+    """Read an ignore file and return its pattern lines.
+
+    Cached per process; the stat fields are part of the key so an edited or
+    replaced file is read again instead of serving stale patterns.
+
+    Args:
+        path: Path to the ignore file
+        mtime_ns: Modification time of the file (cache key only)
+        size: Size of the file (cache key only)
+        inode: Inode number of the file (cache key only)
+
+    Returns:
+        Tuple of stripped pattern lines, without blanks and comments
+    """
+    patterns: List[str] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            s = raw.strip()
+            if not s or s.startswith("#"):
+                continue
+            patterns.append(s)
+    return tuple(patterns)
+
+
+def _read_ignore_file(path: str) -> Tuple[str, ...]:
+    """Return the pattern lines of an ignore file, parsing it at most once per version.
+
+    Args:
+        path: Path to the ignore file
+
+    Returns:
+        Tuple of stripped pattern lines, without blanks and comments
+    """
+    st = os.stat(path)
+    return _parse_ignore_file(path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _CompiledPatterns:
+    """An ordered set of ignore patterns compiled for matching.
+
+    Holds the active patterns with their literal fast paths, the combined
+    union regex and the prefilter built from them, see
+    IgnorePatternsHandler._categorize_matched_patterns().
+    """
+
+    def __init__(self, lines: List[str]) -> None:
+        """Compile pattern lines.
+
+        Args:
+            lines: Pattern lines in precedence order (the last matching one decides)
+        """
+        spec = PathSpec.from_lines(_compile_pattern, lines)
+        active = [p for p in spec.patterns if p.include is not None and p.regex is not None]
+        self.has_negations = any(p.include is False for p in active)
+        self.union = _compile_union(active)
+        # Active patterns with their literal fast path, in precedence order
+        self.matchers = [(pattern_obj, *_literal_fast_path(pattern_obj)) for pattern_obj in active]
+        self.literal_names = frozenset(name for _, name, _ in self.matchers if name is not None)
+        self.literal_suffixes = tuple(suffix for _, _, suffix in self.matchers if suffix is not None)
+        # Union of the patterns that have no literal fast path; together with the
+        # literal names and suffixes it rejects most paths without the full union
+        self.glob_union = _compile_union(
+            [pattern_obj for pattern_obj, name, suffix in self.matchers if name is None and suffix is None]
+        )
+
+
 class IgnorePatternsHandler:
     """Handles all ignore logic including patterns and binary files.
     
@@ -58,55 +205,134 @@ class IgnorePatternsHandler:
         
         # Store patterns by origin for tracking
         self._patterns_by_origin: Dict[str, List[str]] = defaultdict(list)
+        self._origin_by_pattern: Dict[str, str] = {}  # pattern -> first origin defining it
         
-        self._spec = self._compile_spec(
-            user=user,
-            use_defaults=use_defaults,
-            read_ignore_files=read_ignore_files,
-        )
+        # Loaded directories (whose .gitignore, if any, has been read) mapped to the
+        # directories with a non-empty .gitignore at or above them, and to the
+        # compiled patterns that apply to the entries directly inside them
+        self._read_ignore_files = read_ignore_files
+        self._scope_by_dir: Dict[str, Tuple[str, ...]] = {}
+        self._compiled_by_dir: Dict[str, _CompiledPatterns] = {}
+        self._compiled_by_scope: Dict[Tuple[str, ...], _CompiledPatterns] = {}
+        self._gitignore_patterns_by_dir: Dict[str, List[str]] = {}
 
-    def _read_gitignore_patterns_with_prefixes(self) -> List[str]:
-        """Read .gitignore patterns with proper directory prefixes."""
-        patterns: List[str] = []
-        for gi in self.root.rglob(".gitignore"):
-            base = gi.parent.relative_to(self.root).as_posix()
-            with gi.open("r", encoding="utf-8") as f:
-                for raw in f:
-                    s = raw.strip()
-                    if not s or s.startswith("#"):
-                        continue
-                    neg = s.startswith("!")
-                    body = s[1:] if neg else s
-                    # Only add prefix if base is not empty and not the root directory
-                    # Both empty string and "." represent the root directory
-                    prefixed = f"{base}/{body}" if base and base not in ("", ".") else body
-                    patterns.append(("!" + prefixed) if neg else prefixed)
-        return patterns
-
-    def _compile_spec(
-        self,
-        user: Iterable[str],
-        *,
-        use_defaults: bool,
-        read_ignore_files: bool,
-    ) -> PathSpec:
-        """Compile all patterns into a PathSpec."""
-        pats: List[str] = []
-        
         # Store patterns by origin for tracking
         if use_defaults:
             self._patterns_by_origin["default"] = list(self.DEFAULT_IGNORE_PATTERNS)
-            pats += self._patterns_by_origin["default"]
-        
         if read_ignore_files:
-            self._patterns_by_origin["gitignore"] = self._read_gitignore_patterns_with_prefixes()
-            pats += self._patterns_by_origin["gitignore"]
-        
+            # Filled lazily as directories are visited, see _patterns_for()
+            self._patterns_by_origin["gitignore"] = []
         # We always add user patterns last so they can override any other patterns
         self._patterns_by_origin["user"] = list(user)
-        pats += self._patterns_by_origin["user"]
 
-        return PathSpec.from_lines("gitwildmatch", pats)
+        # Reverse index for O(1) origin lookups; earlier origins take precedence
+        for origin, patterns in self._patterns_by_origin.items():
+            for pattern in patterns:
+                self._origin_by_pattern.setdefault(pattern, origin)
+
+    def _read_gitignore_patterns(self, base: str) -> List[str]:
+        """Read the .gitignore of one directory with proper directory prefixes.
+
+        Args:
+            base: Directory relative to root ("" for the root directory)
+
+        Returns:
+            Prefixed patterns, empty if the directory has no .gitignore
+        """
+        gi = os.path.join(self.root, base, ".gitignore")
+        try:
+            # One stat() (the cache key) also tells whether the file exists
+            lines = _read_ignore_file(gi)
+        except OSError:
+            return []
+
+        patterns: List[str] = []
+        for s in lines:
+            neg = s.startswith("!")
+            body = s[1:] if neg else s
+            # Only add prefix if base is not the root directory
+            prefixed = f"{base}/{body}" if base else body
+            patterns.append(("!" + prefixed) if neg else prefixed)
+        return patterns
+
+    def _patterns_for(self, rel_path: str) -> _CompiledPatterns:
+        """Return the compiled patterns that apply to a path.
+
+        Ignore files are picked up while the tree is walked instead of in a
+        separate recursive search up front; ancestors are loaded top-down.
+        Patterns of a nested .gitignore are prefixed with its directory and can
+        only match below it, so a path is matched against the default and user
+        patterns plus the .gitignore files of its own ancestors (nested ones
+        after, and taking precedence over, their parents). Each distinct chain
+        of .gitignore files is compiled once, instead of recompiling every
+        pattern seen so far whenever another .gitignore turns up.
+
+        Args:
+            rel_path: Relative path of a file or directory about to be matched
+
+        Returns:
+            Compiled patterns for the directory containing rel_path
+        """
+        directory = rel_path.rpartition("/")[0]
+        compiled = self._compiled_by_dir.get(directory)
+        if compiled is not None:
+            return compiled
+
+        missing: List[str] = []
+        while directory not in self._scope_by_dir:
+            missing.append(directory)
+            if not directory:
+                break
+            directory = directory.rpartition("/")[0]
+
+        for directory in reversed(missing):
+            scope = self._scope_by_dir[directory.rpartition("/")[0]] if directory else ()
+            if self._read_ignore_files:
+                patterns = self._read_gitignore_patterns(directory)
+                if patterns:
+                    scope += (directory,)
+                    self._add_gitignore_patterns(directory, patterns)
+            self._scope_by_dir[directory] = scope
+
+            compiled = self._compiled_by_scope.get(scope)
+            if compiled is None:
+                compiled = _CompiledPatterns(self._scope_lines(scope))
+                self._compiled_by_scope[scope] = compiled
+            self._compiled_by_dir[directory] = compiled
+
+        return compiled
+
+    def _add_gitignore_patterns(self, directory: str, patterns: List[str]) -> None:
+        """Record the patterns of a newly loaded .gitignore.
+
+        Args:
+            directory: Directory of the .gitignore relative to root
+            patterns: Its prefixed patterns
+        """
+        self._gitignore_patterns_by_dir[directory] = patterns
+        self._patterns_by_origin["gitignore"] += patterns
+        for pattern in patterns:
+            # .gitignore patterns come after the defaults but before user patterns
+            if self._origin_by_pattern.get(pattern, "user") == "user":
+                self._origin_by_pattern[pattern] = "gitignore"
+
+    def _scope_lines(self, scope: Tuple[str, ...]) -> List[str]:
+        """Pattern lines that apply below a chain of .gitignore directories, in precedence order.
+
+        Args:
+            scope: Directories whose .gitignore applies, top-down
+
+        Returns:
+            Default, .gitignore and user pattern lines
+        """
+        lines: List[str] = []
+        for origin, patterns in self._patterns_by_origin.items():
+            if origin == "gitignore":
+                for directory in scope:
+                    lines += self._gitignore_patterns_by_dir[directory]
+            else:
+                lines += patterns
+        return lines
 
     def _check_binary_file(self, full_path: str) -> tuple[bool, Optional[str]]:
         """Check if file is binary and track its extension.
@@ -119,33 +345,81 @@ class IgnorePatternsHandler:
         """
         is_binary = self.binary_detector.is_binary(full_path)
         if is_binary:
-            ext = Path(full_path).suffix.lower()
+            # Same result as Path(full_path).suffix without building a Path per file
+            ext = os.path.splitext(full_path)[1].lower()
+            if ext == ".":
+                ext = ""
             if ext:
                 self._binary_extensions.add(ext)
             return is_binary, ext
         return is_binary, None
 
-    def _categorize_matched_patterns(self, rel_path: str) -> tuple[List[str], List[str]]:
-        """Categorize patterns into positive (ignore) and negation (exception) lists.
+    def _categorize_matched_patterns(self, rel_path: str) -> tuple[bool, List[str], List[str]]:
+        """Match a path against all patterns in a single pass.
+
+        Follows PathSpec.match_file semantics (the last matching pattern decides)
+        while collecting which patterns matched. One combined regex rejects paths
+        that no pattern can match and locates the first matching pattern, so
+        earlier patterns are never tried individually; literal names and
+        suffixes skip the regex engine entirely, and paths that match none of
+        them nor any remaining glob are rejected without the full union.
 
         Args:
             rel_path: Relative path for pattern matching
 
         Returns:
-            Tuple of (positive_patterns, negation_patterns)
+            Tuple of (is_ignored, positive_patterns, negation_patterns)
         """
+        patterns = self._patterns_for(rel_path)
+        if patterns.union is None:
+            return False, [], []
+
+        components = frozenset(rel_path.split("/"))
+        # No literal name pattern can match unless a path component is one of them
+        literal_hit = not patterns.literal_names.isdisjoint(components)
+        # Most paths match no pattern at all: prove that with set and suffix
+        # checks plus the (much smaller) union of the remaining glob patterns
+        # before paying for the full union
+        if not (
+            literal_hit
+            or (patterns.literal_suffixes and any(c.endswith(patterns.literal_suffixes) for c in components))
+            or (patterns.glob_union is not None and patterns.glob_union.match(rel_path))
+        ):
+            return False, [], []
+
+        match = patterns.union.match(rel_path)
+        if match is None:
+            return False, [], []
+
+        is_ignored = False
         positive_patterns = []  # Normal ignore patterns that matched
         negation_patterns = []  # Negation patterns (!pattern) that matched
 
-        for pattern_obj in self._spec.patterns:
-            if pattern_obj.match_file(rel_path):
-                pattern_str = str(pattern_obj.pattern)
-                if pattern_obj.include is False:  # Negation pattern (starts with !)
-                    negation_patterns.append(pattern_str)
-                else:  # Normal ignore pattern
-                    positive_patterns.append(pattern_str)
-
-        return positive_patterns, negation_patterns
+        # The union already found the first matching pattern; only the ones
+        # after it still need to be checked individually
+        first = int(match.lastgroup[1:])
+        matchers = patterns.matchers
+        for index in range(first, len(matchers)):
+            pattern_obj, literal_name, literal_suffix = matchers[index]
+            if index > first:
+                # Plain names and *.ext suffixes are checked per path component
+                # without going through the regex engine
+                if literal_name is not None:
+                    matched = literal_hit and literal_name in components
+                elif literal_suffix is not None:
+                    matched = any(component.endswith(literal_suffix) for component in components)
+                else:
+                    matched = pattern_obj.match_file(rel_path) is not None
+                if not matched:
+                    continue
+            is_ignored = pattern_obj.include
+            pattern_str = str(pattern_obj.pattern)
+            if pattern_obj.include is False:  # Negation pattern (starts with !)
+                negation_patterns.append(pattern_str)
+            else:  # Normal ignore pattern
+                positive_patterns.append(pattern_str)
+
+        return is_ignored, positive_patterns, negation_patterns
 
     def _update_pattern_statistics(self, patterns: List[str]) -> None:
         """Update pattern match statistics.
@@ -166,11 +440,10 @@ class IgnorePatternsHandler:
         Returns:
             List of matching patterns for tracking
         """
-        # Use PathSpec's match_file to get correct ignore decision (handles negation)
-        is_ignored_by_patterns = self._spec.match_file(rel_path)
-
-        # Track which patterns matched (for statistics and debugging)
-        positive_patterns, negation_patterns = self._categorize_matched_patterns(rel_path)
+        # Get the ignore decision (handles negation) and the matched patterns in one pass
+        is_ignored_by_patterns, positive_patterns, negation_patterns = (
+            self._categorize_matched_patterns(rel_path)
+        )
 
         # Determine which patterns to count for statistics
         # - If file is ignored: count positive patterns (they caused the ignore)
@@ -186,6 +459,31 @@ class IgnorePatternsHandler:
         else:
             return []
 
+    def should_skip_dir(self, rel_dir: str) -> bool:
+        """Check whether a directory can be left out of the walk entirely.
+
+        A directory is skipped when a pattern matches the directory path
+        itself, which (for gitwildmatch) means the pattern also matches every
+        path below it. The path is matched with a trailing slash so that
+        directory-only rules such as ``__pycache__/`` apply as well. With negation
+        patterns a file inside could be re-included, so nothing is skipped while
+        any apply to the directory, nor with include_binary, where binary files
+        bypass the patterns. Like git, .gitignore files inside a skipped
+        directory are never read.
+
+        Args:
+            rel_dir: Directory path relative to root
+
+        Returns:
+            True if every file under the directory would be ignored by patterns
+        """
+        if self.include_binary:
+            return False
+        patterns = self._patterns_for(rel_dir)
+        if patterns.has_negations or patterns.union is None:
+            return False
+        return patterns.union.match(rel_dir + "/") is not None
+
     def is_ignored(self, rel_path: str, full_path: str) -> Dict:
         """Check if a file should be ignored and return detailed information.
 
@@ -232,7 +530,7 @@ class IgnorePatternsHandler:
             "is_binary": is_binary,
             "ignore_reasons": ignore_reasons,
             "matched_patterns": matching_patterns,
-            "binary_extension": Path(full_path).suffix.lower() if is_binary else None
+            "binary_extension": binary_ext
         }
 
         # Store complete data for all files (ignored or not)
@@ -242,10 +540,7 @@ class IgnorePatternsHandler:
     
     def get_pattern_source(self, pattern: str) -> str:
         """Get the source origin of a specific pattern."""
-        for origin, patterns in self._patterns_by_origin.items():
-            if pattern in patterns:
-                return origin
-        return "unknown"
+        return self._origin_by_pattern.get(pattern, "unknown")
     
     def get_binary_extensions(self) -> List[str]:
         """Get extensions that were blocked as binary."""
@@ -268,11 +563,11 @@ class IgnorePatternsHandler:
     
     def get_ignore_stats(self) -> Dict:
         """Get comprehensive ignore statistics."""
-        ignored_files = [f for f, data in self._checked_files.items() if data["is_ignored"]]
+        ignored_files_count = sum(1 for data in self._checked_files.values() if data["is_ignored"])
         return {
             "pattern_matches": dict(self._pattern_matches),
             "binary_extensions": list(self._binary_extensions),
-            "ignored_files_count": len(ignored_files),
+            "ignored_files_count": ignored_files_count,
             "total_checked_files": len(self._checked_files),
             "patterns_by_origin": self.get_active_patterns_by_origin()
         }
@@ -283,4 +578,4 @@ class IgnorePatternsHandler:
     
     def list_patterns(self) -> List[str]:
         """Get all compiled patterns (for debugging)."""
-        return [str(p.pattern) for p in self._spec.patterns]
+        return [pattern for patterns in self._patterns_by_origin.values() for pattern in patterns]
@@ -1,5 +1,10 @@
 from typing import Dict, Optional, Set, List
-from anytree import NodeMixin, PostOrderIter, PreOrderIter
+from anytree import NodeMixin
+
+# NodeMixin's private hook that links a node under a parent without the parent
+# setter's loop check. It is not public API, so fall back to the setter when an
+# anytree release no longer has it.
+_attach_to_parent = getattr(NodeMixin, "_NodeMixin__attach", None)
 
 
 class FileSystemNode(NodeMixin):
@@ -26,6 +31,17 @@ class FileSystemNode(NodeMixin):
     - File I/O (use FileDiscoverer)
     """
 
+    # One node exists per file and directory, so attributes live in slots. NodeMixin
+    # has no __slots__ of its own, so instances still get a __dict__; listing its
+    # (name-mangled) parent and children attributes here as well keeps every
+    # attribute the tree sets in a slot and leaves that __dict__ empty.
+    __slots__ = (
+        "name", "is_directory", "relative_path", "extension", "flags",
+        "file_size", "file_tokens", "file_created", "file_modified",
+        "aggregate_size", "aggregate_tokens", "aggregate_created", "aggregate_modified",
+        "dirty", "_NodeMixin__parent", "_NodeMixin__children",
+    )
+
     def __init__(
         self,
         name: str,
@@ -39,7 +55,6 @@ class FileSystemNode(NodeMixin):
         self.is_directory = is_directory
         self.relative_path = relative_path
         self.extension = extension
-        self.parent = parent
 
         self.flags: Set[str] = set()
         self.file_size: int = 0
@@ -52,13 +67,21 @@ class FileSystemNode(NodeMixin):
         self.aggregate_modified: Optional[str] = None
         self.dirty: bool = True
 
+        if isinstance(parent, FileSystemNode) and _attach_to_parent is not None:
+            # A node that was just created has no children, so attaching it cannot
+            # form a loop. Skip the parent setter's loop check, which walks all
+            # ancestors of the new parent (O(depth) per node while building a tree).
+            _attach_to_parent(self, parent)
+        else:
+            self.parent = parent
+
     # ---- metrics ----
     @property
     def size(self) -> int:
         if not self.is_directory:
             return self.file_size
         if self.dirty:
-            self.recompute_aggregates_for_node()
+            self._recompute_dirty_aggregates()
         return self.aggregate_size
 
     @property
@@ -66,7 +89,7 @@ class FileSystemNode(NodeMixin):
         if not self.is_directory:
             return self.file_tokens
         if self.dirty:
-            self.recompute_aggregates_for_node()
+            self._recompute_dirty_aggregates()
         return self.aggregate_tokens
 
     @property
@@ -74,7 +97,7 @@ class FileSystemNode(NodeMixin):
         if not self.is_directory:
             return self.file_created
         if self.dirty:
-            self.recompute_aggregates_for_node()
+            self._recompute_dirty_aggregates()
         return self.aggregate_created
 
     @property
@@ -82,7 +105,7 @@ class FileSystemNode(NodeMixin):
         if not self.is_directory:
             return self.file_modified
         if self.dirty:
-            self.recompute_aggregates_for_node()
+            self._recompute_dirty_aggregates()
         return self.aggregate_modified
 
     def set_file_metrics(
@@ -131,17 +154,55 @@ class FileSystemNode(NodeMixin):
 
         This is called when a node's data changes, so that aggregate
         metrics will be recalculated on next access.
+
+        Ancestors of a dirty directory are always dirty too, so the walk stops at
+        the first ancestor that is already marked. While a tree is being built
+        every directory is still dirty, which makes this O(1) per file.
         """
-        node: Optional["FileSystemNode"] = self
-        while node is not None:
+        self.dirty = True
+        node = self.parent
+        while node is not None and not node.dirty:
             node.dirty = True
             node = node.parent
 
+    def _post_attach(self, parent: "FileSystemNode") -> None:
+        """anytree hook: a new child changes the parent's aggregates."""
+        parent.mark_dirty_up()
+
+    def _post_detach(self, parent: "FileSystemNode") -> None:
+        """anytree hook: a removed child changes the former parent's aggregates."""
+        parent.mark_dirty_up()
+
     def recompute_aggregates(self) -> None:
         """Recompute all aggregate metrics for all directory nodes in tree."""
-        for node in PostOrderIter(self):
-            if node.is_directory:
-                node.recompute_aggregates_for_node()
+        self._recompute_directories(only_dirty=False)
+
+    def _recompute_dirty_aggregates(self) -> None:
+        """Recompute aggregates of the dirty directories in this subtree.
+
+        Clean directories are skipped together with their subtrees: a dirty
+        directory always has dirty ancestors, so a clean one has none below it.
+        """
+        self._recompute_directories(only_dirty=True)
+
+    def _recompute_directories(self, *, only_dirty: bool) -> None:
+        """Recompute directory aggregates bottom-up without recursion.
+
+        Directories are collected top-down with an explicit stack and processed
+        in reverse, so every child directory is up to date before its parent
+        and deep trees cannot hit the interpreter's recursion limit.
+        """
+        directories: List["FileSystemNode"] = []
+        stack: List["FileSystemNode"] = [self]
+        while stack:
+            node = stack.pop()
+            if not node.is_directory or (only_dirty and not node.dirty):
+                continue
+            directories.append(node)
+            stack.extend(node.children)
+
+        for node in reversed(directories):
+            node.recompute_aggregates_for_node()
 
     def recompute_aggregates_for_node(self) -> None:
         """Recompute aggregate metrics for this directory node.
@@ -154,31 +215,64 @@ class FileSystemNode(NodeMixin):
 
         This is called automatically when accessing size/tokens/dates on a dirty directory.
         """
-        # Aggregate sizes
-        self.aggregate_size = sum(child.size for child in self.children)
-
-        # Aggregate token counts by key
+        # Single pass over the children: anytree builds a new tuple on every
+        # .children access, and each metric property is a dispatch of its own
+        size = 0
         aggregated: Dict[str, int] = {}
+        created: Optional[str] = None
+        modified: Optional[str] = None
         for child in self.children:
-            for key, value in (child.tokens or {}).items():
-                aggregated[key] = aggregated.get(key, 0) + int(value)
+            # Read the stored metrics directly instead of through the properties;
+            # in a bottom-up pass child directories are already up to date
+            if child.is_directory:
+                if child.dirty:
+                    child._recompute_dirty_aggregates()
+                child_size = child.aggregate_size
+                child_tokens = child.aggregate_tokens
+                child_created = child.aggregate_created
+                child_modified = child.aggregate_modified
+            else:
+                child_size = child.file_size
+                child_tokens = child.file_tokens
+                child_created = child.file_created
+                child_modified = child.file_modified
+
+            size += child_size
+
+            # Aggregate token counts by key
+            for key, value in child_tokens.items():
+                aggregated[key] = aggregated.get(key, 0) + value
+
+            # Created: earliest (minimum) date from children
+            if child_created and (created is None or child_created < created):
+                created = child_created
+
+            # Modified: latest (maximum) date from children
+            if child_modified and (modified is None or child_modified > modified):
+                modified = child_modified
+
+        self.aggregate_size = size
         self.aggregate_tokens = aggregated
-
-        # Aggregate dates
-        # Created: earliest (minimum) date from children
-        created_dates = [child.created for child in self.children if child.created]
-        self.aggregate_created = min(created_dates) if created_dates else None
-
-        # Modified: latest (maximum) date from children
-        modified_dates = [child.modified for child in self.children if child.modified]
-        self.aggregate_modified = max(modified_dates) if modified_dates else None
-
+        self.aggregate_created = created
+        self.aggregate_modified = modified
         self.dirty = False
 
     def get_file_paths(self) -> List[str]:
-        """Get all file paths in this tree (excluding directories)."""
-        return [node.relative_path for node in PreOrderIter(self)
-                if not node.is_directory and node.relative_path]
+        """Get all file paths in this tree (excluding directories).
+
+        Paths are in pre-order, as listed by PreOrderIter. The walk uses an
+        explicit stack and reads each directory's children once, avoiding
+        the iterator's per-node overhead.
+        """
+        paths: List[str] = []
+        stack: List["FileSystemNode"] = [self]
+        while stack:
+            node = stack.pop()
+            if node.is_directory:
+                stack.extend(reversed(node.children))
+            elif node.relative_path:
+                paths.append(node.relative_path)
+        return paths
 
     def stats(self) -> Dict:
         """Get statistics for this node as a dictionary.
@@ -1,8 +1,25 @@
-import os
+import gc
+from functools import lru_cache
 from typing import Dict
 from projectsummarizer.files.tree.node import FileSystemNode
 
 
+@lru_cache(maxsize=8192)
+def _extension_of_name(basename: str) -> str:
+    """Extract the lowercase extension (without dot) from a file name.
+
+    Cached by name since names like __init__.py or README.md repeat across a tree.
+    Leading dots are not extension separators, matching os.path.splitext.
+    """
+    # Handle dotfiles like .gitignore (extension is everything after the dot)
+    if basename.startswith(".") and basename.count(".") == 1:
+        return basename[1:].lower()
+    # Normal files: extract extension
+    stem = basename.lstrip(".")
+    dot = stem.rfind(".")
+    return stem[dot + 1:].lower() if dot != -1 else ""
+
+
 class FileSystemTree:
     """Builds a filesystem tree structure from files metadata.
 
@@ -45,13 +62,7 @@ class FileSystemTree:
         Returns:
             Extension without dot in lowercase: "py", "gitignore"
         """
-        basename = os.path.basename(relative_path)
-        # Handle dotfiles like .gitignore (extension is everything after the dot)
-        if basename.startswith(".") and basename.count(".") == 1:
-            return basename[1:].lower()
-        # Normal files: extract extension
-        _, extension = os.path.splitext(basename)
-        return extension[1:].lower() if extension.startswith(".") else ""
+        return _extension_of_name(relative_path.rpartition("/")[2])
 
     def __init__(self, files_data: Dict[str, Dict]) -> None:
         """Build a filesystem tree from files metadata.
@@ -73,45 +84,80 @@ class FileSystemTree:
             >>> tree = FileSystemTree(files_data)
             >>> print(tree.root.size)
         """
+        # Every object allocated while building stays alive, and nodes reference
+        # each other (parent <-> children). On large trees the allocations keep
+        # triggering the cyclic garbage collector, which rescans the growing tree
+        # each time without ever finding garbage, so it is paused meanwhile.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.root = self._build(files_data)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    @staticmethod
+    def _build(files_data: Dict[str, Dict]) -> FileSystemNode:
+        """Create the nodes for files_data and compute their aggregates.
+
+        Args:
+            files_data: Dictionary mapping relative paths to file metadata
+
+        Returns:
+            Root node of the tree
+        """
         # Build root node
         root_node = FileSystemNode(name="", is_directory=True, relative_path="")
         index: Dict[str, FileSystemNode] = {"": root_node}
 
-        # Build tree structure from file paths
+        def get_directory(directory_path: str) -> FileSystemNode:
+            """Return the node for a directory path, creating missing ancestors top-down."""
+            node = index.get(directory_path)
+            if node is not None:
+                return node
+
+            # Find the closest existing ancestor, then create the missing levels below it
+            missing: list[str] = []
+            while node is None:
+                missing.append(directory_path)
+                directory_path = directory_path.rpartition("/")[0]
+                node = index.get(directory_path)
+
+            for path in reversed(missing):
+                node = FileSystemNode(
+                    name=path.rpartition("/")[2],
+                    is_directory=True,
+                    relative_path=path,
+                    parent=node
+                )
+                index[path] = node
+            return node
+
+        # Build tree structure from file paths. Only the parent directory is looked
+        # up per file; intermediate directories are created once, on first use.
         for relative_path, data in files_data.items():
-            parent = root_node
-            current_path = ""
-            path_parts = self.extract_path_parts(relative_path)
-
-            # Create intermediate directory nodes and final file node
-            for i, part in enumerate(path_parts):
-                current_path = f"{current_path}/{part}" if current_path else part
-                node = index.get(current_path)
-                is_directory = i < len(path_parts) - 1
-
-                if node is None:
-                    node = FileSystemNode(
-                        name=part,
-                        is_directory=is_directory,
-                        relative_path=current_path,
-                        parent=parent
-                    )
-                    index[current_path] = node
-                parent = node
-
-            # Set file metadata on the leaf node
-            file_node = index[current_path]
-            file_node.extension = self.extract_extension(relative_path)
+            parent_path, _, name = relative_path.rpartition("/")
+            file_node = FileSystemNode(
+                name=name,
+                is_directory=False,
+                relative_path=relative_path,
+                parent=get_directory(parent_path)
+            )
+            index[relative_path] = file_node
+
+            # Set file metadata on the leaf node. Missing tokens and flags are not
+            # replaced by new empty containers: the node starts out with its own.
+            file_node.extension = _extension_of_name(name)
             file_node.set_file_metrics(
                 size=data.get("size", 0),
-                tokens=data.get("tokens", {}),
+                tokens=data.get("tokens"),
                 created=data.get("created"),
                 modified=data.get("modified")
             )
-            for flag in data.get("flags", set()):
+            for flag in data.get("flags", ()):
                 file_node.mark_flag(flag)
 
         # Compute aggregate metrics for all directories
         root_node.recompute_aggregates()
-        self.root = root_node
+        return root_node
 
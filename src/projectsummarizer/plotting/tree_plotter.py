@@ -1,16 +1,49 @@
 """Tree plotting and ASCII visualization."""
 
-from typing import List
+from functools import lru_cache
+from typing import Callable, List, Tuple
 from projectsummarizer.files.tree.node import FileSystemNode
 
 
+def _child_sort_key(sort_by: str) -> Callable[[FileSystemNode], tuple]:
+    """Pick the sort key function for sort_by once, instead of branching per child.
+
+    Directories always sort before files. Date keys are meant to be used with
+    reverse=True (newest first), which is why their directory flag is inverted.
+
+    Args:
+        sort_by: 'name', 'size', 'created', 'modified', or a token model name
+
+    Returns:
+        Key function for sorting sibling nodes
+    """
+    if sort_by == "name":
+        return lambda child: (not child.is_directory, child.name.lower())
+    if sort_by == "size":
+        # Sort by size descending (negate for reverse), then by name
+        return lambda child: (not child.is_directory, -child.size, child.name.lower())
+    if sort_by in ("created", "modified"):
+        # Newest first via reverse=True; use a low date value for None to sort them to the end
+        return lambda child: (child.is_directory, getattr(child, sort_by) or "0000-00-00", child.name.lower())
+
+    # Treat sort_by as a token model name
+    def token_key(child: FileSystemNode) -> tuple:
+        tokens = child.tokens
+        return (not child.is_directory, -(tokens.get(sort_by, 0) if tokens else 0), child.name.lower())
+    return token_key
+
+
 class TreePlotter:
     """Plots filesystem trees in various formats."""
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def format_size(bytes_value: int) -> str:
         """Convert bytes to human-readable format.
 
+        Results are cached: file sizes repeat a lot across a tree (empty files,
+        __init__.py stubs, copies of the same asset).
+
         Args:
             bytes_value: Size in bytes
 
@@ -51,82 +84,65 @@ class TreePlotter:
             ASCII tree representation as string
         """
         lines: List[str] = []
+        format_size = TreePlotter.format_size
 
         def format_stats(node: FileSystemNode) -> str:
-            """Format statistics for a node using its own stats."""
-            if not show_stats:
-                return ""
-
-            node_stats = node.stats()
-            if not node_stats:
-                return ""
-
-            parts = []
-            for stat_name, stat_value in node_stats.items():
-                if stat_name == "size":
-                    parts.append(TreePlotter.format_size(stat_value))
-                elif stat_name in ["created", "modified"]:
-                    parts.append(f"{stat_name}: {stat_value}")
-                else:
-                    parts.append(f"{stat_name}:{stat_value}")
-
-            return " (" + "; ".join(parts) + ")" if parts else ""
-
-        def walk(node: FileSystemNode, prefix: str = ""):
-            # Define sorting key based on sort_by parameter
-            def sort_key(child: FileSystemNode):
-                # Always sort directories before files
-                is_file = not child.is_directory
-
-                if sort_by == "name":
-                    return (is_file, child.name.lower())
-                elif sort_by == "size":
-                    # Sort by size descending (negate for reverse), then by name
-                    return (is_file, -child.size, child.name.lower())
-                elif sort_by == "created":
-                    # Sort by created date, newest first (descending)
-                    # Use low date value for None to sort them to end
-                    # Negate by using reverse=True in sorted() or by string reversal trick
-                    date_value = child.created if child.created else "0000-00-00"
-                    # Reverse the date string for descending sort (newer dates = higher strings reversed = lower)
-                    # Instead, we'll negate after: return tuple with negative comparison
-                    return (not is_file, date_value, child.name.lower())
-                elif sort_by == "modified":
-                    # Sort by modified date, newest first (descending)
-                    # Use low date value for None to sort them to end
-                    date_value = child.modified if child.modified else "0000-00-00"
-                    return (not is_file, date_value, child.name.lower())
-                else:
-                    # Treat sort_by as a token model name
-                    token_count = child.tokens.get(sort_by, 0) if child.tokens else 0
-                    return (is_file, -token_count, child.name.lower())
-
-            # Sort with reverse=True for date sorting to get newest first
-            # This preserves the directories-first ordering from is_file in the sort key
-            if sort_by in ["created", "modified"]:
-                children = sorted(node.children, key=sort_key, reverse=True)
-            else:
-                children = sorted(node.children, key=sort_key)
-            for index, child in enumerate(children):
-                is_last = index == len(children) - 1
-                branch = "└── " if is_last else "├── "
-
-                # Format node name and stats
-                node_name = child.name + ("/" if child.is_directory else "")
-                stats = format_stats(child)
-                lines.append(prefix + branch + node_name + stats)
-
-                if child.is_directory:
-                    extend = "    " if is_last else "│   "
-                    walk(child, prefix + extend)
+            """Format statistics for a node using its own stats.
+
+            Same fields and order as node.stats() (size, token counts, dates),
+            read straight from the node instead of through a dict per line.
+            """
+            parts = [format_size(node.size)]
+            tokens = node.tokens
+            if tokens:
+                parts += [f"{model}:{count}" for model, count in tokens.items()]
+            created = node.created
+            if created:
+                parts.append(f"created: {created}")
+            modified = node.modified
+            if modified:
+                parts.append(f"modified: {modified}")
+            return f" ({'; '.join(parts)})"
+
+        def no_stats(node: FileSystemNode) -> str:
+            return ""
+
+        node_stats = format_stats if show_stats else no_stats
+
+        sort_key = _child_sort_key(sort_by)
+
+        # Sort with reverse=True for date sorting to get newest first
+        # This preserves the directories-first ordering from is_file in the sort key
+        reverse = sort_by in ["created", "modified"]
+
+        def push_children(node: FileSystemNode, prefix: str) -> None:
+            # Pushed in reverse so the first child is popped (and printed) first
+            children = sorted(node.children, key=sort_key, reverse=reverse)
+            for index in range(len(children) - 1, -1, -1):
+                stack.append((children[index], prefix, index == len(children) - 1))
+
+        # Depth-first walk with an explicit stack: deep trees cannot hit the
+        # recursion limit, and every line is appended once and joined at the end
+        stack: List[Tuple[FileSystemNode, str, bool]] = []
 
         # Root node
         root_name = "."
-        root_stats = format_stats(root)
-        lines.append(root_name + root_stats)
+        lines.append(root_name + node_stats(root))
 
         # Children
-        walk(root, "")
+        push_children(root, "")
+        while stack:
+            child, prefix, is_last = stack.pop()
+            branch = "└── " if is_last else "├── "
+
+            # Format node name and stats
+            if child.is_directory:
+                lines.append(f"{prefix}{branch}{child.name}/{node_stats(child)}")
+                extend = "    " if is_last else "│   "
+                push_children(child, prefix + extend)
+            else:
+                lines.append(f"{prefix}{branch}{child.name}{node_stats(child)}")
+
         return "\n".join(lines)
 
 
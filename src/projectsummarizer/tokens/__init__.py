@@ -1,17 +1,23 @@
 """Token counting utilities for various AI models."""
 
 from projectsummarizer.tokens.counter import TokenCounter
-from projectsummarizer.tokens.openai import get_openai_token_count, list_openai_models
-from projectsummarizer.tokens.anthropic import get_anthropic_token_count, list_anthropic_models
-from projectsummarizer.tokens.google import get_google_token_count, list_google_models
-from projectsummarizer.tokens.primitive import get_primitive_token_count, list_primitive_models
+from projectsummarizer.tokens.cache import TokenCountCache
+from projectsummarizer.tokens.openai import get_openai_token_count, get_openai_token_counts, list_openai_models
+from projectsummarizer.tokens.anthropic import get_anthropic_token_count, get_anthropic_token_counts, list_anthropic_models
+from projectsummarizer.tokens.google import get_google_token_count, get_google_token_counts, list_google_models
+from projectsummarizer.tokens.primitive import get_primitive_token_count, get_primitive_token_counts, list_primitive_models
 
 __all__ = [
     "TokenCounter",
+    "TokenCountCache",
     "get_openai_token_count",
     "get_anthropic_token_count",
     "get_google_token_count",
     "get_primitive_token_count",
+    "get_openai_token_counts",
+    "get_anthropic_token_counts",
+    "get_google_token_counts",
+    "get_primitive_token_counts",
     "list_openai_models",
     "list_anthropic_models",
     "list_google_models",
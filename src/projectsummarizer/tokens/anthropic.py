@@ -13,8 +13,11 @@ For safe local-only token counting, use:
 """
 
 import logging
-import anthropic
 import os
+from functools import lru_cache
+from typing import List, Optional
+
+from projectsummarizer.tokens.cache import TokenCountCache, content_digest
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,27 @@ def get_anthropic_api_key():
         raise RuntimeError("CLAUDE_API_KEY is not set. Please configure it in your .env file.")
     return api_key
 
+@lru_cache(maxsize=None)
+def _get_client(api_key: str):
+    """Return an Anthropic client for an API key, created once per process.
+
+    The client owns an HTTP connection pool; reusing it keeps connections to
+    the API open across batches instead of reconnecting for every batch. It is
+    safe to share between threads.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        anthropic.Anthropic client
+    """
+    # The SDK is imported on first use: it is slow to import and most runs
+    # never count tokens with Anthropic models
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
+
+
 def get_anthropic_token_count(messages, model_name):
     """
     Calculates the number of tokens in the given messages for an Anthropic model.
@@ -51,8 +75,10 @@ def get_anthropic_token_count(messages, model_name):
     if not messages or all(not msg.get("content", "").strip() for msg in messages):
         return 0
 
+    import anthropic  # For its exception types; see _get_client()
+
     try:
-        client = anthropic.Anthropic(api_key=get_anthropic_api_key())
+        client = _get_client(get_anthropic_api_key())
         return client.messages.count_tokens(model=model_name, messages=messages).input_tokens
     except RuntimeError:
         # API key not set - re-raise with context
@@ -74,11 +100,88 @@ def get_anthropic_token_count(messages, model_name):
         return -1
 
 
+def get_anthropic_token_counts(
+    texts: List[str],
+    model_name: str,
+    cache: Optional[TokenCountCache] = None
+) -> List[int]:
+    """
+    Calculates the number of tokens for each of the given texts for an Anthropic model.
+    Note: This makes one API call per non-empty, uncached text and requires CLAUDE_API_KEY
+    unless every text is cached.
+
+    Privacy NOTE: This function DOES NOT operate LOCALLY. It sends the texts to Anthropic servers to count the tokens.
+    Use with caution.
+
+    One client (and its connection pool) is shared by all batches instead of
+    being created for every text.
+
+    Args:
+        texts: Text contents, each counted as a single user message
+        model_name: Anthropic model name (e.g., 'claude-sonnet-4-5-20250929')
+        cache: Optional persistent cache; hits skip the API call, new counts are stored
+
+    Returns:
+        Number of tokens per text (same order), -1 for texts that failed
+
+    Raises:
+        RuntimeError: If CLAUDE_API_KEY is not set
+    """
+    counts: List[Optional[int]] = [0 if not text.strip() else None for text in texts]
+
+    digests: List[Optional[bytes]] = [None] * len(texts)
+    if cache is not None:
+        missing = [index for index, count in enumerate(counts) if count is None]
+        for index in missing:
+            digests[index] = content_digest(texts[index])
+        cached = cache.get_many([digests[index] for index in missing], model_name)
+        for index in missing:
+            counts[index] = cached.get(digests[index])
+
+    missing = [index for index, count in enumerate(counts) if count is None]
+    if not missing:
+        return counts
+
+    import anthropic  # For its exception types; see _get_client()
+
+    try:
+        client = _get_client(get_anthropic_api_key())
+    except RuntimeError:
+        # API key not set - re-raise with context
+        raise RuntimeError(
+            f"CLAUDE_API_KEY is required for counting tokens with Anthropic models. "
+            f"Please set it in your .env file. See: https://console.anthropic.com/settings/keys"
+        )
+
+    new_counts = []
+    for index in missing:
+        try:
+            messages = [{"role": "user", "content": texts[index]}]
+            counts[index] = client.messages.count_tokens(model=model_name, messages=messages).input_tokens
+            new_counts.append((digests[index], counts[index]))
+        except anthropic.NotFoundError as e:
+            # Model not found
+            logger.error(f"Anthropic model '{model_name}' not found: {e}")
+            counts[index] = -1
+        except anthropic.BadRequestError as e:
+            logger.error(f"Bad request for Anthropic model '{model_name}': {e}")
+            counts[index] = -1
+        except Exception as e:
+            # Other unexpected errors
+            logger.error(f"Error counting tokens for Anthropic model '{model_name}': {e}")
+            counts[index] = -1
+
+    if cache is not None and new_counts:
+        cache.put_many(new_counts, model_name)
+
+    return counts
+
+
 def list_anthropic_models():
     """
     Lists available Anthropic models.
     """
-    client = anthropic.Anthropic(api_key=get_anthropic_api_key())
+    client = _get_client(get_anthropic_api_key())
     models = client.models.list()
 
     return sorted([model.id for model in models])
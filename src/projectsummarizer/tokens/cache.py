@@ -0,0 +1,151 @@
+"""Persistent token count cache keyed by content hash.
+
+Counting tokens with API-backed models (Anthropic) costs one network round trip
+per file. Counts only depend on the content and the model, so they are stored in
+a small SQLite database and reused across runs for unchanged files.
+
+PRIVACY: Only content hashes, model names and counts are stored - never content.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Try to import blake3 (SIMD-accelerated hashing), but make it optional
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_SELECT_CHUNK_SIZE = 500
+
+
+def default_cache_path() -> Path:
+    """Return the default location of the token cache database.
+
+    Uses $XDG_CACHE_HOME when set, ~/.cache otherwise.
+    """
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "projectsummarizer" / "tokens.sqlite"
+
+
+def content_digest(text: str) -> bytes:
+    """Return the cache key of a text: a 128-bit digest of its UTF-8 bytes.
+
+    Uses BLAKE3 when the blake3 package is installed (several times faster on
+    large files) and BLAKE2b otherwise. Keys of the two hashes never collide in
+    practice, so a cache written with one of them stays valid with the other;
+    entries are just not shared between them.
+    """
+    data = text.encode("utf-8", "surrogatepass")
+    if HAS_BLAKE3:
+        return blake3(data).digest(length=16)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class TokenCountCache:
+    """SQLite-backed store of token counts by (content digest, model).
+
+    Safe to share between threads. If the database cannot be opened or written,
+    a warning is logged once and the cache silently turns into a no-op, so token
+    counting never fails because of the cache.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Database file path (default: see default_cache_path())
+        """
+        self.path = Path(path) if path else default_cache_path()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use. Must be called with the lock held."""
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS token_counts ("
+                    "digest BLOB NOT NULL, model TEXT NOT NULL, count INTEGER NOT NULL, "
+                    "PRIMARY KEY (digest, model)) WITHOUT ROWID"
+                )
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+        return self._conn
+
+    def _disable(self, error: Exception) -> None:
+        """Stop using the cache after an error. Must be called with the lock held."""
+        logger.warning(f"Token count cache at {self.path} is unavailable, continuing without it: {error}")
+        self._disabled = True
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_many(self, digests: List[bytes], model: str) -> Dict[bytes, int]:
+        """Look up cached counts.
+
+        Args:
+            digests: Content digests (see content_digest())
+            model: Model name
+
+        Returns:
+            Dictionary mapping the digests found in the cache to their counts
+        """
+        found: Dict[bytes, int] = {}
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return found
+            try:
+                for start in range(0, len(digests), _SELECT_CHUNK_SIZE):
+                    chunk = digests[start:start + _SELECT_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT digest, count FROM token_counts WHERE model = ? AND digest IN ({placeholders})",
+                        (model, *chunk),
+                    )
+                    found.update(rows)
+            except sqlite3.Error as e:
+                self._disable(e)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, int]], model: str) -> None:
+        """Store counts.
+
+        Args:
+            items: Pairs of (content digest, token count)
+            model: Model name
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO token_counts (digest, model, count) VALUES (?, ?, ?)",
+                    ((digest, model, count) for digest, count in items),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
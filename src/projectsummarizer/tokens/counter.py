@@ -1,14 +1,20 @@
 """Token counting orchestrator for various AI models."""
 
-from typing import Dict, List
-from projectsummarizer.tokens.openai import get_openai_token_count
-from projectsummarizer.tokens.anthropic import get_anthropic_token_count
-from projectsummarizer.tokens.google import get_google_token_count
-from projectsummarizer.tokens.primitive import get_primitive_token_count
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from projectsummarizer.tokens.openai import get_openai_token_counts
+from projectsummarizer.tokens.anthropic import get_anthropic_token_counts
+from projectsummarizer.tokens.google import get_google_token_counts
+from projectsummarizer.tokens.primitive import get_primitive_token_counts
+from projectsummarizer.tokens.cache import TokenCountCache, content_digest
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct contents whose counts are remembered for the current run
+_MEMO_SIZE = 4096
+
 
 class TokenCounter:
     """Orchestrates token counting for content using various models."""
@@ -19,9 +25,22 @@ class TokenCounter:
     ANTHROPIC_PREFIXES = ("claude-",)
     PRIMITIVE_PREFIXES = ("chars-",)
 
-    def __init__(self, models: List[str]):
-        """Initialize with list of model names (e.g., ['gpt-4o'])."""
+    def __init__(self, models: List[str], *, cache: Optional[TokenCountCache] = None):
+        """Initialize with list of model names (e.g., ['gpt-4o']).
+
+        Args:
+            models: Model names to count tokens for
+            cache: Optional persistent cache for API-backed (Anthropic) counts
+        """
         self.models = models
+        self.cache = cache
+
+        # Counts by content digest, so duplicate files (licenses, vendored or
+        # generated copies) are tokenized once. Character counts are cheaper
+        # than hashing, so the memo is only used when a real tokenizer is involved.
+        self._memo: "OrderedDict[bytes, Dict[str, int]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self._use_memo = any(not model.startswith(self.PRIMITIVE_PREFIXES) for model in models)
 
     def _get_provider_for_model(self, model: str) -> str:
         """Determine the provider based on model name prefix.
@@ -56,7 +75,66 @@ class TokenCounter:
             ValueError: If model prefix is unknown or model is not supported
             RuntimeError: If API credentials are not configured
         """
-        counts: Dict[str, int] = {}
+        return self.count_tokens_batch([content])[0]
+
+    def count_tokens_batch(self, contents: List[str]) -> List[Dict[str, int]]:
+        """Return token counts per model for each of several contents.
+
+        Each model's tokenizer (or API client) is set up once for the whole
+        batch rather than once per content. Contents identical to one counted
+        recently (in this or an earlier batch) are not counted again.
+
+        Args:
+            contents: Text contents to count tokens for
+
+        Returns:
+            List of dictionaries mapping model names to token counts, in the
+            same order as contents
+
+        Raises:
+            ValueError: If model prefix is unknown or model is not supported
+            RuntimeError: If API credentials are not configured
+        """
+        if not contents or not self._use_memo:
+            return self._count_contents(contents)
+
+        digests = [content_digest(content) for content in contents]
+        found: Dict[bytes, Dict[str, int]] = {}
+        with self._memo_lock:
+            for digest in digests:
+                memoized = self._memo.get(digest)
+                if memoized is not None:
+                    self._memo.move_to_end(digest)
+                    found[digest] = memoized
+
+        # Count each distinct content that is not memoized once
+        missing: Dict[bytes, str] = {}
+        for digest, content in zip(digests, contents):
+            if digest not in found:
+                missing.setdefault(digest, content)
+        if missing:
+            new_counts = dict(zip(missing, self._count_contents(list(missing.values()))))
+            found.update(new_counts)
+            with self._memo_lock:
+                self._memo.update(new_counts)
+                while len(self._memo) > _MEMO_SIZE:
+                    self._memo.popitem(last=False)
+
+        # Every content gets its own dict, as callers store them per file
+        return [dict(found[digest]) for digest in digests]
+
+    def _count_contents(self, contents: List[str]) -> List[Dict[str, int]]:
+        """Count tokens of every content with every model, without the memo.
+
+        Args:
+            contents: Text contents to count tokens for
+
+        Returns:
+            List of dictionaries mapping model names to token counts
+        """
+        counts: List[Dict[str, int]] = [{} for _ in contents]
+        if not contents:
+            return counts
 
         for model in self.models:
             provider = self._get_provider_for_model(model)
@@ -68,24 +146,22 @@ class TokenCounter:
                 )
 
             if provider == "openai":
-                token_count = get_openai_token_count(content, model)
+                token_counts = get_openai_token_counts(contents, model)
             elif provider == "anthropic":
-                # Anthropic requires messages format
-                token_count = get_anthropic_token_count(
-                    [{"role": "user", "content": content}], model
-                )
+                token_counts = get_anthropic_token_counts(contents, model, cache=self.cache)
             elif provider == "google":
-                token_count = get_google_token_count(content, model)
+                token_counts = get_google_token_counts(contents, model)
             elif provider == "primitive":
-                token_count = get_primitive_token_count(content, model)
+                token_counts = get_primitive_token_counts(contents, model)
 
-            # Check if the token counting failed (returned -1)
-            if token_count < 0:
-                raise ValueError(
-                    f"Failed to count tokens for model '{model}'. "
-                    f"The model may not exist or may not be supported by the {provider} tokenizer."
-                )
+            for content_counts, token_count in zip(counts, token_counts):
+                # Check if the token counting failed (returned -1)
+                if token_count < 0:
+                    raise ValueError(
+                        f"Failed to count tokens for model '{model}'. "
+                        f"The model may not exist or may not be supported by the {provider} tokenizer."
+                    )
 
-            counts[model] = token_count
+                content_counts[model] = token_count
 
         return counts
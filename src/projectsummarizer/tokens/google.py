@@ -11,12 +11,26 @@ Note: Gemini 2.0+ models use cloud-based tokenization APIs (not implemented here
 This module only supports Gemini 1.x models with local tokenization.
 """
 
-from vertexai.preview.tokenization import get_tokenizer_for_model
+from typing import List
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _get_tokenizer(model_name: str):
+    """Load the local tokenizer of a Gemini model.
+
+    Vertex AI is imported here rather than at module level: the import takes
+    seconds and is only needed when a Gemini model is actually requested.
+
+    Raises:
+        ValueError: If the model is not supported
+    """
+    from vertexai.preview.tokenization import get_tokenizer_for_model
+
+    return get_tokenizer_for_model(model_name)
+
+
 def get_google_token_count(text: str, model_name: str) -> int:
     """
     Calculates the number of tokens in the given text for a Google Gemini model.
@@ -33,7 +47,7 @@ def get_google_token_count(text: str, model_name: str) -> int:
         Number of tokens, or -1 if model is not found or there's an error
     """
     try:
-        tokenizer = get_tokenizer_for_model(model_name)
+        tokenizer = _get_tokenizer(model_name)
         result = tokenizer.count_tokens(text)
         return result.total_tokens
     except ValueError as e:
@@ -46,6 +60,41 @@ def get_google_token_count(text: str, model_name: str) -> int:
         return -1
 
 
+def get_google_token_counts(texts: List[str], model_name: str) -> List[int]:
+    """
+    Calculates the number of tokens for each of the given texts for a Google Gemini model.
+
+    PRIVACY: Uses LOCAL tokenization, see get_google_token_count().
+    The tokenizer is loaded once for the whole batch instead of once per text.
+
+    Args:
+        texts: Text contents to tokenize
+        model_name: Google model name (e.g., 'gemini-1.5-flash-002')
+
+    Returns:
+        Number of tokens per text (same order), -1 for texts that failed or
+        for every text if the model is not found
+    """
+    try:
+        tokenizer = _get_tokenizer(model_name)
+    except ValueError as e:
+        # Model not found or invalid model name
+        logger.error(f"Google model '{model_name}' not found or invalid: {e}")
+        return [-1] * len(texts)
+    except Exception as e:
+        logger.error(f"Error counting tokens for Google model '{model_name}': {e}")
+        return [-1] * len(texts)
+
+    counts: List[int] = []
+    for text in texts:
+        try:
+            counts.append(tokenizer.count_tokens(text).total_tokens)
+        except Exception as e:
+            logger.error(f"Error counting tokens for Google model '{model_name}': {e}")
+            counts.append(-1)
+    return counts
+
+
 def list_google_models():
     """
     Lists available Google Gemini models for offline tokenization.
@@ -10,12 +10,68 @@ Cookbook: https://cookbook.openai.com/examples/how_to_count_tokens_with_tiktoken
 """
 
 import logging
+import re
+from functools import lru_cache
+from typing import List
+
 import tiktoken
 from tiktoken.model import MODEL_TO_ENCODING, MODEL_PREFIX_TO_ENCODING
 
 
 logger = logging.getLogger(__name__)
 
+# Texts longer than this (in characters) are encoded in pieces, so the token
+# list of a large file is never held in memory at once
+_ENCODE_CHUNK_CHARS = 1 << 20
+
+# Positions right after a newline that sits between two non-whitespace characters.
+# Every tiktoken pre-tokenizer starts a new piece there and lookaheads see the
+# same input, so splitting the text at these positions does not change the count.
+_SAFE_SPLIT = re.compile(r"(?<=\S\n)(?=\S)")
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model_name: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding of a model, resolved once per process.
+
+    tiktoken keeps loaded encodings in a registry, but every lookup still maps
+    the model name (scanning prefixes for dated model names) and takes the
+    registry lock. Failed lookups are not cached.
+
+    Args:
+        model_name: OpenAI model name (e.g., 'gpt-4o')
+
+    Returns:
+        tiktoken encoding
+
+    Raises:
+        KeyError: If the model is not in tiktoken's registry
+    """
+    return tiktoken.encoding_for_model(model_name)
+
+
+def _count_encoded_tokens(enc: tiktoken.Encoding, text: str) -> int:
+    """Count the tokens of a text, encoding long texts chunk by chunk.
+
+    Args:
+        enc: tiktoken encoding
+        text: Text content to tokenize
+
+    Returns:
+        Number of tokens
+    """
+    if len(text) <= _ENCODE_CHUNK_CHARS:
+        return len(enc.encode(text))
+
+    total = 0
+    start = 0
+    while start < len(text):
+        split = _SAFE_SPLIT.search(text, start + _ENCODE_CHUNK_CHARS)
+        end = split.start() if split else len(text)
+        total += len(enc.encode(text[start:end]))
+        start = end
+    return total
+
 
 def get_openai_token_count(text: str, model_name: str) -> int:
     """
@@ -35,9 +91,8 @@ def get_openai_token_count(text: str, model_name: str) -> int:
         Number of tokens, or -1 if model is not found
     """
     try:
-        enc = tiktoken.encoding_for_model(model_name)
-        tokens = enc.encode(text)
-        return len(tokens)
+        enc = _get_encoding(model_name)
+        return _count_encoded_tokens(enc, text)
     except KeyError:
         # Model not found in tiktoken's registry
         logger.error(f"OpenAI model '{model_name}' not found in tiktoken registry")
@@ -47,6 +102,40 @@ def get_openai_token_count(text: str, model_name: str) -> int:
         return -1
 
 
+def get_openai_token_counts(texts: List[str], model_name: str) -> List[int]:
+    """
+    Calculates the number of tokens for each of the given texts for an OpenAI model.
+
+    The encoding is looked up once for the whole batch and cached across batches.
+
+    Args:
+        texts: Text contents to tokenize
+        model_name: OpenAI model name (e.g., 'gpt-4o')
+
+    Returns:
+        Number of tokens per text (same order), -1 for texts that failed or
+        for every text if the model is not found
+    """
+    try:
+        enc = _get_encoding(model_name)
+    except KeyError:
+        # Model not found in tiktoken's registry
+        logger.error(f"OpenAI model '{model_name}' not found in tiktoken registry")
+        return [-1] * len(texts)
+    except Exception as e:
+        logger.error(f"Error counting tokens for OpenAI model '{model_name}': {e}")
+        return [-1] * len(texts)
+
+    counts: List[int] = []
+    for text in texts:
+        try:
+            counts.append(_count_encoded_tokens(enc, text))
+        except Exception as e:
+            logger.error(f"Error counting tokens for OpenAI model '{model_name}': {e}")
+            counts.append(-1)
+    return counts
+
+
 def list_openai_models():
     """
     Lists available OpenAI models and encodings.
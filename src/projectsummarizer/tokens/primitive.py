@@ -9,6 +9,7 @@ PRIVACY: Completely local operation. No data is sent anywhere. No external depen
 
 import logging
 import math
+from typing import List
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,20 @@ def get_primitive_token_count(text: str, model_name: str) -> int:
         return -1
 
 
+def get_primitive_token_counts(texts: List[str], model_name: str) -> List[int]:
+    """
+    Estimates the number of tokens for each of the given texts.
+
+    Args:
+        texts: Text contents to estimate
+        model_name: Model name in format "chars-{ratio}" (e.g., "chars-4")
+
+    Returns:
+        Number of tokens per text (same order), -1 for every text if the model name is invalid
+    """
+    return [get_primitive_token_count(text, model_name) for text in texts]
+
+
 def list_primitive_models():
     """
     Lists available character-based tokenization models.
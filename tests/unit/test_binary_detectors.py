@@ -0,0 +1,98 @@
+"""Unit tests for the binary detectors."""
+
+import random
+
+import pytest
+
+from projectsummarizer.files.discovery.binary_detectors.heuristic_binary_detector import HeuristicBinaryDetector
+
+
+def _printable_ratio(data: bytes) -> float:
+    printable = sum(1 for byte in data if (32 <= byte <= 126) or byte in (9, 10, 13) or byte >= 128)
+    return printable / len(data)
+
+
+class TestHeuristicBinaryDetector:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_looks_like_text_uses_the_printable_ratio(self, seed):
+        rng = random.Random(seed)
+        detector = HeuristicBinaryDetector()
+        for _ in range(50):
+            control_share = rng.random()
+            data = bytes(
+                rng.randrange(0, 32) if rng.random() < control_share else rng.randrange(32, 256)
+                for _ in range(rng.randrange(1, 400))
+            )
+            assert detector._looks_like_text(data) == (_printable_ratio(data) >= 0.70)
+
+    def test_binary_and_text_files(self, tmp_path):
+        detector = HeuristicBinaryDetector()
+        (tmp_path / "a.py").write_text("print('hi')\n", encoding="utf-8")
+        (tmp_path / "blob.dat").write_bytes(b"\x01\x02\x00\x03")
+        (tmp_path / "image.png").write_bytes(b"not even a png")
+
+        assert not detector.is_binary(str(tmp_path / "a.py"))
+        assert detector.is_binary(str(tmp_path / "blob.dat"))
+        assert detector.is_binary(str(tmp_path / "image.png"))
+
+    @pytest.mark.parametrize("data", [
+        b"x = 1\n",
+        "caf\u00e9 na\u00efve\n".encode("latin-1"),
+        b"\x01\x02\x80" * 100,
+        b"a\x00b",
+        "hello".encode("utf-16"),
+    ])
+    def test_known_text_extensions_use_the_same_heuristics(self, tmp_path, data):
+        detector = HeuristicBinaryDetector()
+        (tmp_path / "notes.TXT").write_bytes(data)
+        (tmp_path / "notes.unknown").write_bytes(data)
+
+        assert detector.is_binary(str(tmp_path / "notes.TXT")) == detector._is_binary_data(data)
+        assert detector.is_binary(str(tmp_path / "notes.unknown")) == detector._is_binary_data(data)
+
+    def test_known_text_extensions_only_sample_the_start(self, tmp_path):
+        detector = HeuristicBinaryDetector()
+        data = b"x" * 10000 + b"\x00"
+        (tmp_path / "late_nul.txt").write_bytes(data)
+        (tmp_path / "late_nul.unknown").write_bytes(data)
+
+        assert not detector.is_binary(str(tmp_path / "late_nul.txt"))
+        assert detector.is_binary(str(tmp_path / "late_nul.unknown"))
+        assert detector.is_binary(str(tmp_path / "missing.py"))
+
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-16-be", "utf-32"])
+    def test_wide_encoded_text_file_is_binary(self, tmp_path, encoding):
+        detector = HeuristicBinaryDetector()
+        path = tmp_path / "notes.txt"
+        path.write_bytes("hello world\n".encode(encoding))
+
+        assert detector.is_binary(str(path))
+
+    @pytest.mark.parametrize("data, expected", [
+        (b"", False),
+        (b"plain ascii\n", False),
+        ("café — utf-8\n".encode("utf-8"), False),
+        ("café latin-1\n".encode("latin-1"), False),
+        (b"\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c", False),  # Uncertain cases count as text
+        (b"text\x00with null", True),
+    ])
+    def test_sample_classification(self, data, expected):
+        assert HeuristicBinaryDetector()._is_binary_data(data) == expected
+
+
+class TestBinaryLibmagicDetector:
+    def test_identical_samples_are_classified_once(self, monkeypatch):
+        pytest.importorskip("magic")
+        from projectsummarizer.files.discovery.binary_detectors.binary_libmagic_detector import BinaryLibmagicDetector
+
+        detector = BinaryLibmagicDetector()
+        calls = []
+        classify = detector._classify
+        monkeypatch.setattr(detector, "_classify", lambda data: calls.append(data) or classify(data))
+
+        assert not detector._is_binary_data(b"print('hi')\n")
+        assert not detector._is_binary_data(b"print('hi')\n")
+        assert detector._is_binary_data(bytes(range(256)) * 4)
+        assert len(calls) == 2
+        # Cookies are shared between instances
+        assert BinaryLibmagicDetector()._magic_mime is detector._magic_mime
@@ -1,6 +1,15 @@
 """Unit tests for FileDiscoverer."""
 
+import os
+
+import pytest
+from pathspec import PathSpec
+
 from projectsummarizer.files.discovery import FileDiscoverer
+from projectsummarizer.files.discovery.binary_detectors.heuristic_binary_detector import HeuristicBinaryDetector
+from projectsummarizer.files.discovery.discoverer import discoverer as discoverer_module
+from projectsummarizer.files.discovery.ignore import IgnorePatternsHandler
+from projectsummarizer.tokens import TokenCounter
 
 
 class TestFileDiscoverer:
@@ -90,3 +99,282 @@ class TestFileDiscoverer:
             assert "folder_2/file_4.txt" in files_data, "folder_2/file_4.txt should be discovered"
             assert "README.md" in files_data, "README.md should be discovered"
 
+    @pytest.mark.parametrize("batch_size", [1, 2, 64])
+    def test_token_counts_are_streamed_in_discovery_order(self, test_project_dir, batch_size):
+        """Test that batched token counting keeps content_processor calls in discovery order."""
+        discoverer = FileDiscoverer(
+            root=str(test_project_dir),
+            read_ignore_files=False,
+            use_defaults=False,
+            token_counter=TokenCounter(["chars-1"]),
+            workers=2,
+            batch_size=batch_size,
+        )
+
+        processed = []
+        files_data = discoverer.discover(
+            lambda path, content, metadata: processed.append((path, metadata["tokens"]["chars-1"], len(content)))
+        )
+
+        # Callbacks arrive in the same order as the returned metadata
+        assert [path for path, _, _ in processed] == list(files_data)
+
+        # Each file's token count matches its own content
+        for path, tokens, content_length in processed:
+            assert tokens == content_length
+            assert files_data[path]["tokens"] == {"chars-1": content_length}
+
+    def test_ignored_directories_are_not_descended(self, test_project_dir):
+        """Test that a directory matched by a pattern is skipped instead of filtered file by file."""
+        discoverer = FileDiscoverer(
+            root=str(test_project_dir),
+            user_patterns=["folder_1"],
+            read_ignore_files=False,
+            use_defaults=False
+        )
+
+        files_data = discoverer.discover()
+
+        assert "folder_1/file_3.txt" not in files_data
+        assert "folder_2/file_4.txt" in files_data
+        # The skipped directory's files were never even checked
+        assert "folder_1/file_3.txt" not in discoverer.ignore_handler.get_checked_files_data()
+
+    def test_ignored_directories_are_walked_when_reporting_removed_files(self, test_project_dir):
+        """Test that pruning is off when ignored files are part of the output."""
+        discoverer = FileDiscoverer(
+            root=str(test_project_dir),
+            user_patterns=["folder_1"],
+            read_ignore_files=False,
+            use_defaults=False,
+            filter_type="removed"
+        )
+
+        files_data = discoverer.discover()
+
+        assert list(files_data) == ["folder_1/file_3.txt"]
+
+    def test_ignored_directories_are_walked_when_including_binary_files(self, tmp_path):
+        """Test that binary files inside an ignored directory are kept with include_binary."""
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "app.bin").write_bytes(b"\x7fELF\x00\x01")
+        (tmp_path / "build" / "notes.txt").write_text("generated", encoding="utf-8")
+        (tmp_path / "main.txt").write_text("source", encoding="utf-8")
+
+        discoverer = FileDiscoverer(
+            root=str(tmp_path),
+            user_patterns=["build"],
+            read_ignore_files=False,
+            use_defaults=False,
+            include_binary=True,
+            binary_detector=HeuristicBinaryDetector(),
+        )
+
+        files_data = discoverer.discover()
+
+        assert sorted(files_data) == ["build/app.bin", "main.txt"]
+
+    def test_negation_inside_ignored_directory_still_applies(self, test_project_dir):
+        """Test that directories are not pruned while negation patterns could re-include files."""
+        discoverer = FileDiscoverer(
+            root=str(test_project_dir),
+            user_patterns=["folder_1", "!folder_1/file_3.txt"],
+            read_ignore_files=False,
+            use_defaults=False
+        )
+
+        files_data = discoverer.discover()
+
+        assert "folder_1/file_3.txt" in files_data
+
+    def test_directory_only_gitignore_rule_prevents_descent(self, tmp_path):
+        """Test that a trailing-slash rule like __pycache__/ prunes the directory itself."""
+        (tmp_path / ".gitignore").write_text("__pycache__/\n", encoding="utf-8")
+        (tmp_path / "foo" / "__pycache__").mkdir(parents=True)
+        (tmp_path / "foo" / "__pycache__" / "notes.txt").write_text("cached", encoding="utf-8")
+        (tmp_path / "foo" / "module.txt").write_text("source", encoding="utf-8")
+
+        discoverer = FileDiscoverer(root=str(tmp_path), use_defaults=False)
+        files_data = discoverer.discover()
+
+        assert "foo/module.txt" in files_data
+        assert "foo/__pycache__/notes.txt" not in files_data
+        assert "foo/__pycache__/notes.txt" not in discoverer.ignore_handler.get_checked_files_data()
+
+    def test_directory_only_gitignore_rule_keeps_binary_files_with_include_binary(self, tmp_path):
+        """Test that a __pycache__/ rule does not drop the binary files inside with include_binary."""
+        (tmp_path / ".gitignore").write_text("__pycache__/\n", encoding="utf-8")
+        (tmp_path / "foo" / "__pycache__").mkdir(parents=True)
+        (tmp_path / "foo" / "__pycache__" / "module.cpython-311.pyc").write_bytes(b"\xa7\r\r\n\x00\x00")
+        (tmp_path / "foo" / "__pycache__" / "notes.txt").write_text("cached", encoding="utf-8")
+
+        discoverer = FileDiscoverer(
+            root=str(tmp_path),
+            use_defaults=False,
+            include_binary=True,
+            binary_detector=HeuristicBinaryDetector(),
+        )
+
+        assert not discoverer.ignore_handler.should_skip_dir("foo/__pycache__")
+        files_data = discoverer.discover()
+
+        assert "foo/__pycache__/module.cpython-311.pyc" in files_data
+        assert "foo/__pycache__/notes.txt" not in files_data
+
+    def test_nested_gitignore_files_only_apply_below_their_directory(self, tmp_path):
+        """Test that sibling .gitignore files, including negations, do not affect each other."""
+        for directory, rules in [("a", "*.log\n!keep.log\n"), ("b", "out/\n")]:
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / ".gitignore").write_text(rules, encoding="utf-8")
+        (tmp_path / "b" / "out").mkdir()
+        (tmp_path / "c").mkdir()
+        for path in ["a/x.log", "a/keep.log", "b/x.log", "b/out/y.txt", "b/z.txt", "c/x.log"]:
+            (tmp_path / path).write_text(path, encoding="utf-8")
+
+        discoverer = FileDiscoverer(root=str(tmp_path), use_defaults=False)
+        files_data = discoverer.discover()
+
+        assert sorted(path for path in files_data if not path.endswith(".gitignore")) == [
+            "a/keep.log", "b/x.log", "b/z.txt", "c/x.log",
+        ]
+        # The negation in a/.gitignore does not stop b/out from being pruned
+        assert "b/out/y.txt" not in discoverer.ignore_handler.get_checked_files_data()
+        assert discoverer.ignore_handler.get_pattern_source("a/*.log") == "gitignore"
+
+    def test_only_kept_files_are_read_and_counted(self, test_project_dir):
+        """Test that filtered-out files never reach the token counter."""
+        counted = []
+
+        class RecordingCounter(TokenCounter):
+            def count_tokens_batch(self, contents):
+                counted.extend(contents)
+                return super().count_tokens_batch(contents)
+
+        discoverer = FileDiscoverer(
+            root=str(test_project_dir),
+            user_patterns=["folder_1"],
+            read_ignore_files=False,
+            use_defaults=False,
+            token_counter=RecordingCounter(["chars-1"]),
+            filter_type="removed"
+        )
+
+        files_data = discoverer.discover()
+
+        assert list(files_data) == ["folder_1/file_3.txt"]
+        assert len(counted) == 1
+        assert files_data["folder_1/file_3.txt"]["tokens"] == {"chars-1": len(counted[0])}
+
+    def test_files_are_not_read_without_a_consumer(self, test_project_dir):
+        """Test that metadata-only discovery does not read file contents."""
+        discoverer = FileDiscoverer(root=str(test_project_dir), read_ignore_files=False, use_defaults=False)
+
+        def fail_read(*args, **kwargs):
+            raise AssertionError("file content should not be read")
+
+        discoverer.content_registry.read = fail_read
+        files_data = discoverer.discover()
+
+        assert files_data["file_2.txt"]["size"] > 0
+        assert files_data["file_2.txt"]["tokens"] == {}
+
+    def test_empty_text_files_are_not_opened(self, tmp_path):
+        """Test that empty text files are skipped without a read while empty binary files keep their placeholder."""
+        (tmp_path / "__init__.py").write_bytes(b"")
+        (tmp_path / "empty.png").write_bytes(b"")
+        (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+        discoverer = FileDiscoverer(root=str(tmp_path), use_defaults=False, include_binary=True)
+
+        read_paths = []
+        read = discoverer.content_registry.read
+
+        def recording_read(file_path, *args, **kwargs):
+            read_paths.append(os.path.basename(file_path))
+            return read(file_path, *args, **kwargs)
+
+        discoverer.content_registry.read = recording_read
+        processed = {}
+        files_data = discoverer.discover(lambda path, content, metadata: processed.update({path: content}))
+
+        assert sorted(read_paths) == ["a.py", "empty.png"]
+        assert processed == {"a.py": "x = 1\n", "empty.png": "binary content (0 bytes)"}
+        assert set(files_data) == {"__init__.py", "a.py", "empty.png"}
+
+    def test_utf16_text_file_is_not_read_as_empty_text(self, tmp_path):
+        """Test that a UTF-16 .txt file gets the binary placeholder instead of empty content."""
+        (tmp_path / "notes.txt").write_bytes("hello world\n".encode("utf-16"))
+        discoverer = FileDiscoverer(
+            root=str(tmp_path),
+            use_defaults=False,
+            include_binary=True,
+            binary_detector=HeuristicBinaryDetector(),
+        )
+
+        processed = {}
+        discoverer.discover(lambda path, content, metadata: processed.update({path: content}))
+
+        assert processed == {"notes.txt": "binary content (26 bytes)"}
+
+    def test_concurrent_directory_listing_keeps_walk_order(self, tmp_path):
+        """Test that listing directories on a thread pool yields files in the same order."""
+        for directory in ["b", "a/y", "a/x", "c"]:
+            (tmp_path / directory).mkdir(parents=True)
+            for name in ["2.txt", "1.txt"]:
+                (tmp_path / directory / name).write_text(directory, encoding="utf-8")
+
+        def discover(scan_workers):
+            return list(FileDiscoverer(root=str(tmp_path), use_defaults=False, scan_workers=scan_workers).discover())
+
+        assert discover(4) == discover(1)
+        assert discover(1)[:3] == ["a/x/1.txt", "a/x/2.txt", "a/y/1.txt"]
+
+    def test_read_ahead_budget_smaller_than_files_completes_in_order(self, test_project_dir, monkeypatch):
+        """Test that discovery still completes when no two batches fit in the read-ahead budget."""
+        def discover():
+            processed = []
+            files_data = FileDiscoverer(
+                root=str(test_project_dir),
+                read_ignore_files=False,
+                use_defaults=False,
+                token_counter=TokenCounter(["chars-1"]),
+                workers=4,
+                batch_size=2,
+            ).discover(lambda path, content, metadata: processed.append((path, content)))
+            return processed, files_data
+
+        expected = discover()
+        monkeypatch.setattr(discoverer_module, "_READ_AHEAD_BYTES", 1)
+        assert discover() == expected
+
+    def test_failing_content_processor_does_not_leave_workers_waiting(self, test_project_dir, monkeypatch):
+        """Test that an error while consuming content releases workers waiting on the budget."""
+        monkeypatch.setattr(discoverer_module, "_READ_AHEAD_BYTES", 1)
+        discoverer = FileDiscoverer(
+            root=str(test_project_dir), read_ignore_files=False, use_defaults=False, workers=4, batch_size=1
+        )
+
+        def fail(path, content, metadata):
+            raise RuntimeError("processing failed")
+
+        with pytest.raises(RuntimeError, match="processing failed"):
+            discoverer.discover(fail)
+
+
+class TestIgnorePatternMatching:
+    """Test that the pattern matching shortcuts agree with PathSpec."""
+
+    @pytest.mark.parametrize("path", [
+        "src/app.py", "build/out.txt", "pkg/build", "img/logo.png", "dist/keep.png",
+        "dist/other.png", "web/app.min.js", "docs/_build/index.html", "docs/build.md",
+        "a/.env.prod.local", "notes.txt~", "lib/gen_x.py", "src/lib/gen_x.py", "axb/c",
+    ])
+    def test_decision_matches_pathspec(self, tmp_path, path):
+        handler = IgnorePatternsHandler(
+            str(tmp_path),
+            user=["build", "*.png", "!dist/keep.png", "*.min.js", "docs/_build", "src/**/gen_*", "a*b"],
+            read_ignore_files=False,
+        )
+
+        is_ignored, _, _ = handler._categorize_matched_patterns(path)
+
+        assert is_ignored == PathSpec.from_lines("gitwildmatch", handler.list_patterns()).match_file(path)
@@ -0,0 +1,91 @@
+"""Unit tests for FileSystemTree and lazy aggregates of FileSystemNode."""
+
+import gc
+
+import pytest
+from anytree import NodeMixin, PreOrderIter
+
+from projectsummarizer.files.tree import FileSystemTree
+from projectsummarizer.files.tree import node as node_module
+
+
+def _build(files_data):
+    return FileSystemTree(files_data).root
+
+
+class TestFileSystemTree:
+    def test_aggregates_are_summed_up_to_root(self):
+        root = _build({
+            "a.txt": {"size": 1, "tokens": {"m": 2}},
+            "dir/b.txt": {"size": 10, "tokens": {"m": 20}},
+            "dir/sub/c.txt": {"size": 100, "tokens": {"m": 200}},
+        })
+        dir_node = next(child for child in root.children if child.name == "dir")
+
+        assert root.size == 111
+        assert root.tokens == {"m": 222}
+        assert dir_node.size == 110
+        assert not root.dirty and not dir_node.dirty
+
+    def test_changing_file_metrics_marks_ancestors_dirty(self):
+        root = _build({"dir/sub/c.txt": {"size": 1}})
+        sub = root.children[0].children[0]
+        leaf = sub.children[0]
+        assert root.size == 1
+
+        leaf.set_file_metrics(size=5)
+
+        assert root.dirty and root.children[0].dirty and sub.dirty
+        assert root.size == 5
+
+    def test_attaching_and_detaching_nodes_marks_parent_dirty(self):
+        root = _build({"dir/c.txt": {"size": 3}, "d.txt": {"size": 4}})
+        assert root.size == 7
+
+        leaf = next(child for child in root.children if not child.is_directory)
+        dir_node = next(child for child in root.children if child.is_directory)
+        leaf.parent = dir_node
+
+        assert root.dirty and dir_node.dirty
+        assert dir_node.size == 7
+
+        leaf.parent = None
+        assert root.size == 3
+
+    def test_anytree_still_has_the_private_attach_hook(self):
+        """Test that anytree still provides the hook used to attach new nodes without a loop check."""
+        assert node_module._attach_to_parent is not None
+        assert callable(getattr(NodeMixin, "_NodeMixin__attach", None))
+
+    def test_nodes_attach_through_the_parent_setter_without_the_hook(self, monkeypatch):
+        monkeypatch.setattr(node_module, "_attach_to_parent", None)
+        root = _build({"dir/c.txt": {"size": 3}, "d.txt": {"size": 4}})
+
+        assert root.size == 7
+        assert root.get_file_paths() == ["dir/c.txt", "d.txt"]
+
+    def test_deep_trees_do_not_hit_the_recursion_limit(self):
+        depth = 1500  # deeper than the default recursion limit
+        path = "/".join(["d"] * depth) + "/leaf.txt"
+        root = _build({path: {"size": 7, "tokens": {"m": 1}}})
+
+        assert root.size == 7
+        assert root.tokens == {"m": 1}
+        assert root.get_file_paths() == [path]
+
+    def test_file_paths_are_listed_in_pre_order(self):
+        root = _build({"b.txt": {}, "a/y.txt": {}, "a/sub/x.txt": {}, "c.txt": {}})
+
+        assert root.get_file_paths() == [node.relative_path for node in PreOrderIter(root) if not node.is_directory]
+        assert root.children[1].get_file_paths() == ["a/y.txt", "a/sub/x.txt"]
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_garbage_collector_state_is_restored(self, enabled):
+        """Test that building a tree leaves the cyclic garbage collector as it was."""
+        was_enabled = gc.isenabled()
+        (gc.enable if enabled else gc.disable)()
+        try:
+            _build({"dir/a.txt": {"size": 1}})
+            assert gc.isenabled() == enabled
+        finally:
+            (gc.enable if was_enabled else gc.disable)()
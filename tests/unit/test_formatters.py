@@ -1,5 +1,7 @@
 """Unit tests for output formatters."""
 
+import os
+import tempfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -102,11 +104,46 @@ class TestStreamingTextFormatter:
         assert content.startswith("Project Structure:")
         assert "## a.py" in content
 
+    def test_body_is_copied_without_sendfile(self, output_file, monkeypatch):
+        def unsupported(*args):
+            raise OSError("sendfile is not supported")
+
+        monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+        with StreamingTextFormatter(str(output_file)) as fmt:
+            fmt.write_content("a.py", "x = 1")
+            fmt.write_tree(".\n└── a.py")
+        content = output_file.read_text()
+        assert content.startswith("Project Structure:")
+        assert content.endswith("## a.py\n\n```\nx = 1\n```\n\n")
+
+    def test_structure_only_output_is_just_the_tree(self, output_file):
+        with StreamingTextFormatter(str(output_file)) as fmt:
+            fmt.write_tree(".")
+        assert output_file.read_text() == "Project Structure:\n```\n.\n```\n"
+        assert [p.name for p in output_file.parent.iterdir()] == [output_file.name]
+
     def test_write_tree_raises_when_file_not_open(self, output_file):
         fmt = StreamingTextFormatter(str(output_file))
         with pytest.raises(RuntimeError):
             fmt.write_tree("tree")
 
+    def test_no_temporary_files_are_left_behind(self, output_file, tmp_path_factory, monkeypatch):
+        temp_dir = tmp_path_factory.mktemp("system_temp")
+        monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+        with StreamingTextFormatter(str(output_file)) as fmt:
+            fmt.write_content("a.py", "x = 1")
+            assert len(list(temp_dir.iterdir())) == 1
+            fmt.write_tree(".\n└── a.py")
+        assert [p.name for p in output_file.parent.iterdir()] == [output_file.name]
+        assert list(temp_dir.iterdir()) == []
+
+    def test_content_is_kept_without_tree(self, output_file):
+        with StreamingTextFormatter(str(output_file)) as fmt:
+            fmt.write_content("a.py", "x = 1")
+        content = output_file.read_text()
+        assert content.startswith("## a.py")
+        assert [p.name for p in output_file.parent.iterdir()] == [output_file.name]
+
     def test_metadata_dates_are_written(self, output_file):
         with StreamingTextFormatter(str(output_file)) as fmt:
             fmt.write_content("a.py", "x = 1", metadata={"created": "2024-01-01", "modified": "2024-06-01"})
@@ -194,6 +231,13 @@ class TestXMLFormatter:
         assert root.find("document/metadata/created").text == "2024-01-01"
         assert root.find("document/metadata/modified").text == "2024-06-01"
 
+    def test_output_is_valid_xml_without_tree(self, output_file):
+        with XMLFormatter(str(output_file)) as fmt:
+            fmt.write_content("a.py", "x = 1")
+        root = ET.parse(str(output_file)).getroot()
+        assert root.tag == "documents"
+        assert root.find("structure") is None
+
     def test_write_tree_raises_when_file_not_open(self, output_file):
         fmt = XMLFormatter(str(output_file))
         with pytest.raises(RuntimeError):
@@ -267,3 +311,25 @@ class TestMarkdownFormatter:
         fmt = MarkdownFormatter(str(output_file))
         with pytest.raises(RuntimeError):
             fmt.write_tree("tree")
+
+
+# ---------------------------------------------------------------------------
+# Output inside the summarized project
+# ---------------------------------------------------------------------------
+
+class TestOutputInsideScannedDirectory:
+    @pytest.mark.parametrize("fmt_type", ["text", "xml", "markdown"])
+    def test_summary_does_not_list_its_own_temporary_files(self, tmp_path, fmt_type):
+        from projectsummarizer.engine import build_tree, render_ascii_tree
+
+        (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+        output_path = tmp_path / "summary.txt"
+
+        with create_formatter(fmt_type, str(output_path)) as fmt:
+            root = build_tree(str(tmp_path), content_processor=fmt.write_content)
+            fmt.write_tree(render_ascii_tree(root, show_stats=False))
+
+        content = output_path.read_text(encoding="utf-8")
+        assert ".summary-" not in content
+        assert root.get_file_paths() == ["a.py"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.py", "summary.txt"]
@@ -0,0 +1,56 @@
+"""Unit tests for OpenAI token counting helpers."""
+
+import random
+
+import pytest
+import tiktoken
+from tiktoken_ext import openai_public
+
+from projectsummarizer.tokens import openai as openai_tokens
+
+
+def _pattern_of(constructor, monkeypatch) -> str:
+    """Get an encoding's pre-tokenizer pattern without downloading its vocabulary."""
+    monkeypatch.setattr(openai_public, "load_tiktoken_bpe", lambda *args, **kwargs: {})
+    return constructor()["pat_str"]
+
+
+def _toy_encoding(pat_str: str) -> tiktoken.Encoding:
+    """Byte-level encoding with a few merges, usable offline."""
+    ranks = {bytes([i]): i for i in range(256)}
+    for merge in [b"  ", b"\n\n", b"ab", b" a", b"abc", b" ab", b"    ", b";\n", b"12", b"\n "]:
+        ranks[merge] = len(ranks)
+    return tiktoken.Encoding("toy", pat_str=pat_str, mergeable_ranks=ranks, special_tokens={})
+
+
+@pytest.mark.parametrize("encoding_name", ["r50k_base", "cl100k_base", "o200k_base"])
+def test_chunked_count_matches_whole_text(monkeypatch, encoding_name):
+    """Test that counting a long text in chunks gives the same result as encoding it at once."""
+    enc = _toy_encoding(_pattern_of(getattr(openai_public, encoding_name), monkeypatch))
+
+    rng = random.Random(0)
+    pieces = ["abc", " ab", "a", "12", "345", ";", " ", "  ", "\n", "\n\n", "\t", "É", "'s", "x"]
+    text = "".join(rng.choice(pieces) for _ in range(20000))
+
+    monkeypatch.setattr(openai_tokens, "_ENCODE_CHUNK_CHARS", 64)
+    assert openai_tokens._count_encoded_tokens(enc, text) == len(enc.encode(text))
+
+
+def test_encoding_is_resolved_once_per_model(monkeypatch):
+    """Test that the encoding of a model is looked up once and reused across calls."""
+    enc = _toy_encoding(r"\S+|\s+")
+    lookups = []
+
+    def encoding_for_model(model_name):
+        lookups.append(model_name)
+        return enc
+
+    monkeypatch.setattr(tiktoken, "encoding_for_model", encoding_for_model)
+    openai_tokens._get_encoding.cache_clear()
+    try:
+        assert openai_tokens.get_openai_token_count("ab ab", "gpt-test") == 3
+        assert openai_tokens.get_openai_token_counts(["ab", "a b"], "gpt-test") == [1, 3]
+    finally:
+        openai_tokens._get_encoding.cache_clear()
+
+    assert lookups == ["gpt-test"]
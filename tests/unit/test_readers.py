@@ -0,0 +1,109 @@
+"""Unit tests for content readers."""
+
+import json
+
+import pytest
+
+from projectsummarizer.contents.readers import (
+    BinaryFileReader,
+    ContentReaderRegistry,
+    NotebookReader,
+    TextFileReader,
+)
+from projectsummarizer.contents.readers.base import read_file_bytes, read_file_text
+
+
+class TestReadFileBytes:
+    @pytest.mark.parametrize("size_hint", [None, 0, 5, 11, 12, 100])
+    def test_whole_file_is_read_for_any_size_hint(self, tmp_path, size_hint):
+        """Test that a stale or missing size hint never truncates or pads the content."""
+        path = tmp_path / "file.txt"
+        path.write_bytes(b"hello world\n")
+
+        assert read_file_bytes(str(path), size_hint) == b"hello world\n"
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            read_file_bytes(str(tmp_path / "missing.txt"), 3)
+
+
+class TestReadFileText:
+    @pytest.mark.parametrize("repeat", [1, 20000])
+    def test_small_and_memory_mapped_files_decode_alike(self, tmp_path, repeat):
+        """Test that files above the mmap threshold decode exactly like small ones."""
+        text = "héllo wörld\n" * repeat
+        path = tmp_path / "file.txt"
+        path.write_bytes(text.encode("utf-8"))
+
+        assert read_file_text(str(path), path.stat().st_size) == text
+
+    def test_invalid_utf8_raises(self, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"\xff" * 200000)
+
+        with pytest.raises(UnicodeDecodeError):
+            read_file_text(str(path), 200000)
+
+
+class TestNotebookReader:
+    def test_v4_cells_are_extracted(self, tmp_path):
+        path = tmp_path / "nb.ipynb"
+        path.write_text(json.dumps({
+            "nbformat": 4, "nbformat_minor": 5, "metadata": {},
+            "cells": [
+                {"cell_type": "markdown", "metadata": {}, "source": ["# Title\n", "text"]},
+                {"cell_type": "code", "metadata": {}, "outputs": [], "execution_count": 1, "source": "x = 1"},
+                {"cell_type": "raw", "metadata": {}, "source": "skipped"},
+                {"cell_type": "code", "metadata": {}, "outputs": [], "execution_count": None, "source": []},
+            ],
+        }), encoding="utf-8")
+
+        content = NotebookReader().read_content(str(path), 0)
+
+        assert content == "# Markdown cell\n# Title\ntext\n\n# Code cell\nx = 1\n\n"
+
+    def test_older_formats_are_converted(self, tmp_path):
+        path = tmp_path / "nb.ipynb"
+        path.write_text(json.dumps({
+            "nbformat": 3, "nbformat_minor": 0, "metadata": {},
+            "worksheets": [{"metadata": {}, "cells": [
+                {"cell_type": "code", "input": "x = 1", "language": "python", "outputs": [], "metadata": {}},
+            ]}],
+        }), encoding="utf-8")
+
+        assert NotebookReader().read_content(str(path), 0) == "# Code cell\nx = 1\n\n"
+
+    def test_invalid_notebook_reads_as_empty(self, tmp_path):
+        path = tmp_path / "nb.ipynb"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert NotebookReader().read_content(str(path), 0) == ""
+
+
+class TestContentReaderRegistry:
+    @staticmethod
+    def _registry():
+        registry = ContentReaderRegistry()
+        registry.register(NotebookReader())
+        registry.register(BinaryFileReader())
+        registry.register(TextFileReader())
+        return registry
+
+    def test_readers_limited_to_other_extensions_are_not_asked(self, tmp_path, monkeypatch):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n", encoding="utf-8")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("notebook reader should not be asked")
+
+        monkeypatch.setattr(NotebookReader, "can_read", fail)
+        registry = self._registry()
+
+        assert registry.read(str(path), file_data={"size": 6, "is_binary": False}) == "x = 1\n"
+        assert registry.read(str(tmp_path / "b.png"), file_data={"size": 3, "is_binary": True}) == "binary content (3 bytes)"
+
+    def test_unreadable_notebook_falls_back_to_later_readers(self, tmp_path):
+        path = tmp_path / "broken.ipynb"
+        path.write_text("not json", encoding="utf-8")
+
+        assert self._registry().read(str(path), file_data={"size": 8, "is_binary": False}) == "not json"
@@ -0,0 +1,67 @@
+"""Unit tests for the persistent token count cache."""
+
+import anthropic
+
+from projectsummarizer.tokens import anthropic as anthropic_tokens
+from projectsummarizer.tokens.anthropic import get_anthropic_token_counts
+from projectsummarizer.tokens.cache import TokenCountCache, content_digest
+
+
+class TestTokenCountCache:
+    def test_counts_persist_across_instances(self, tmp_path):
+        path = tmp_path / "tokens.sqlite"
+        digest = content_digest("hello")
+
+        cache = TokenCountCache(str(path))
+        cache.put_many([(digest, 3)], "model-a")
+        cache.close()
+
+        reopened = TokenCountCache(str(path))
+        assert reopened.get_many([digest], "model-a") == {digest: 3}
+        # Counts are per model
+        assert reopened.get_many([digest], "model-b") == {}
+
+    def test_unusable_location_disables_cache(self, tmp_path):
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        cache = TokenCountCache(str(blocker / "tokens.sqlite"))
+
+        cache.put_many([(content_digest("x"), 1)], "model-a")
+        assert cache.get_many([content_digest("x")], "model-a") == {}
+
+    def test_cached_anthropic_counts_skip_the_api(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("CLAUDE_API_KEY", raising=False)
+        cache = TokenCountCache(str(tmp_path / "tokens.sqlite"))
+        cache.put_many([(content_digest("cached text"), 42)], "claude-test")
+
+        # No API key is needed when every non-empty text is cached
+        assert get_anthropic_token_counts(["cached text", "  "], "claude-test", cache=cache) == [42, 0]
+
+    def test_content_digest_without_blake3(self, monkeypatch):
+        monkeypatch.setattr("projectsummarizer.tokens.cache.HAS_BLAKE3", False)
+
+        assert len(content_digest("hello")) == 16
+        assert content_digest("hello") == content_digest("hello")
+        assert content_digest("hello") != content_digest("hello!")
+
+    def test_anthropic_client_is_reused_across_batches(self, monkeypatch):
+        created = []
+
+        class FakeClient:
+            def __init__(self, api_key):
+                created.append(api_key)
+                self.messages = self
+
+            def count_tokens(self, model, messages):
+                return type("Count", (), {"input_tokens": len(messages[0]["content"])})()
+
+        monkeypatch.setenv("CLAUDE_API_KEY", "test-key")
+        monkeypatch.setattr(anthropic, "Anthropic", FakeClient)
+        anthropic_tokens._get_client.cache_clear()
+        try:
+            assert get_anthropic_token_counts(["ab"], "claude-test") == [2]
+            assert get_anthropic_token_counts(["abc", "d"], "claude-test") == [3, 1]
+        finally:
+            anthropic_tokens._get_client.cache_clear()
+
+        assert created == ["test-key"]
@@ -0,0 +1,47 @@
+"""Unit tests for TokenCounter."""
+
+from projectsummarizer.tokens import TokenCounter
+from projectsummarizer.tokens import counter as counter_module
+
+
+def _counting_tokenizer(monkeypatch):
+    """Route openai-prefixed models to a fake tokenizer that records its inputs."""
+    seen = []
+
+    def fake_counts(texts, model_name):
+        seen.extend(texts)
+        return [len(text.split()) for text in texts]
+
+    monkeypatch.setattr(counter_module, "get_openai_token_counts", fake_counts)
+    return seen
+
+
+class TestTokenCounter:
+    def test_duplicate_contents_are_counted_once(self, monkeypatch):
+        seen = _counting_tokenizer(monkeypatch)
+        counter = TokenCounter(["gpt-test"])
+
+        first = counter.count_tokens_batch(["a b", "c", "a b"])
+        second = counter.count_tokens_batch(["c", "d e f"])
+
+        assert first == [{"gpt-test": 2}, {"gpt-test": 1}, {"gpt-test": 2}]
+        assert second == [{"gpt-test": 1}, {"gpt-test": 3}]
+        assert seen == ["a b", "c", "d e f"]
+        # Each content gets a dict of its own
+        assert first[0] is not first[2]
+
+    def test_memo_keeps_only_recent_contents(self, monkeypatch):
+        seen = _counting_tokenizer(monkeypatch)
+        monkeypatch.setattr(counter_module, "_MEMO_SIZE", 2)
+        counter = TokenCounter(["gpt-test"])
+
+        for text in ["a", "b", "c", "a"]:
+            counter.count_tokens(text)
+
+        assert seen == ["a", "b", "c", "a"]
+
+    def test_character_counts_are_not_memoized(self):
+        counter = TokenCounter(["chars-1"])
+
+        assert counter.count_tokens_batch(["abc", "abc"]) == [{"chars-1": 3}, {"chars-1": 3}]
+        assert not counter._memo
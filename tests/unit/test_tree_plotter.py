@@ -0,0 +1,31 @@
+"""Unit tests for TreePlotter."""
+
+from projectsummarizer.files.tree import FileSystemTree
+from projectsummarizer.plotting import TreePlotter
+
+
+class TestTreePlotter:
+    def test_plot_ascii_layout(self):
+        root = FileSystemTree({
+            "b.txt": {"size": 1},
+            "a/z.txt": {"size": 2},
+            "a/y/x.txt": {"size": 3},
+        }).root
+
+        assert TreePlotter().plot_ascii(root, show_stats=False) == "\n".join([
+            ".",
+            "├── a/",
+            "│   ├── y/",
+            "│   │   └── x.txt",
+            "│   └── z.txt",
+            "└── b.txt",
+        ])
+
+    def test_plot_ascii_deep_tree(self):
+        depth = 1500  # deeper than the default recursion limit
+        root = FileSystemTree({"/".join(["d"] * depth) + "/leaf.txt": {"size": 7}}).root
+
+        lines = TreePlotter().plot_ascii(root, show_stats=False).split("\n")
+
+        assert len(lines) == depth + 2
+        assert lines[-1] == "    " * depth + "└── leaf.txt"